@@ -9,174 +9,467 @@ deployments to resolve conflicts.
 import os
 import sys
 import argparse
-import boto3
-from boto3.session import Session
+import contextlib
+import functools
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
+from utils import client_factory, shared_session
 
 
-def list_agentcore_resources(agent_name_pattern="sbom"):
-    """List AgentCore-related resources that might cause conflicts."""
-    print(f"🔍 Searching for AgentCore resources matching pattern: '{agent_name_pattern}'")
-    
-    boto_session = Session()
-    region = boto_session.region_name
-    
-    if not region:
-        print("❌ AWS region not configured. Please set AWS_DEFAULT_REGION or configure AWS CLI.")
-        return []
-    
-    print(f"📍 Searching in region: {region}")
+# Adaptive retries back off on throttling when many calls run in parallel; the
+# wider connection pool lets the delete threads share a client without queueing
+BOTO_CONFIG_OPTIONS = {
+    'retries': {'max_attempts': 10, 'mode': 'adaptive'},
+    'max_pool_connections': 50,
+}
+
+# Upper bound on concurrent delete calls, kept low to stay under API rate limits
+MAX_DELETE_WORKERS = 8
+
+# AgentCore Runtime writes its logs under this prefix
+AGENTCORE_LOG_GROUP_PREFIX = '/aws/bedrock-agentcore'
+
+# IAM path searched for execution roles; '/' covers every role in the account
+DEFAULT_IAM_PATH_PREFIX = '/'
+
+# AWS error codes grouped by how the cleanup reacts to them
+ACCESS_DENIED_CODES = frozenset({'AccessDenied', 'AccessDeniedException', 'UnauthorizedOperation'})
+THROTTLING_CODES = frozenset({'Throttling', 'ThrottlingException', 'TooManyRequestsException'})
+NOT_FOUND_CODES = frozenset({
+    'NoSuchEntity',
+    'ResourceNotFoundException',
+    'RepositoryNotFoundException',
+})
+
+# Clients for the whole run, built once per region from the shared session
+_client = client_factory(**BOTO_CONFIG_OPTIONS)
+
+
+@dataclass(slots=True)
+class Resource:
+    """A discovered AWS resource and the call that deletes it."""
+    type: str
+    name: str
+    arn: Optional[str]
+    created: Any
+    service: str
+    region: str
+    delete_method: str
+    delete_params: Dict[str, Any]
+    requires_policy_cleanup: bool = False
+
+
+def _error_code(error):
+    """Return the AWS error code carried by a ClientError, or '' for other errors."""
+    return getattr(error, 'response', {}).get('Error', {}).get('Code', '')
+
+
+def _name_matcher(marker, agent_name_pattern):
+    """Build a predicate for names containing both the service marker and the pattern."""
+    def matches(name):
+        return marker in name and agent_name_pattern in name
     
+    return matches
+
+
+def _report_scan_error(error, description):
+    """Report a failed listing call, re-raising errors worth retrying."""
+    code = _error_code(error)
+    if code in THROTTLING_CODES:
+        raise error
+    if code in ACCESS_DENIED_CODES:
+        print(f"⚠️  Not authorized to list {description} ({code})")
+    else:
+        print(f"⚠️  Could not list {description}: {error}")
+
+
+def _scan_ecr(agent_name_pattern, region):
+    """Find ECR repositories created for AgentCore Runtime deployments."""
     resources = []
     
-    # Check ECR repositories
     try:
-        ecr_client = boto3.client('ecr', region_name=region)
-        response = ecr_client.describe_repositories()
+        ecr_client = _client('ecr', region)
+        paginator = ecr_client.get_paginator('describe_repositories')
+        matches = _name_matcher('agentcore-runtime', agent_name_pattern)
         
-        for repo in response.get('repositories', []):
-            repo_name = repo.get('repositoryName', '')
-            if 'agentcore-runtime' in repo_name and agent_name_pattern in repo_name:
-                resources.append({
-                    'type': 'ECR Repository',
-                    'name': repo_name,
-                    'arn': repo.get('repositoryArn'),
-                    'created': repo.get('createdAt'),
-                    'client': ecr_client,
-                    'delete_method': 'delete_repository',
-                    'delete_params': {'repositoryName': repo_name, 'force': True}
-                })
+        for page in paginator.paginate(PaginationConfig={'PageSize': 1000}):
+            for repo in page.get('repositories', []):
+                repo_name = repo.get('repositoryName', '')
+                if matches(repo_name):
+                    resources.append(Resource(
+                        type='ECR Repository',
+                        name=repo_name,
+                        arn=repo.get('repositoryArn'),
+                        created=repo.get('createdAt'),
+                        service='ecr',
+                        region=region,
+                        delete_method='delete_repository',
+                        delete_params={'repositoryName': repo_name, 'force': True}
+                    ))
                 
-    except Exception as e:
-        print(f"⚠️  Could not list ECR repositories: {str(e)}")
+    except ClientError as e:
+        _report_scan_error(e, 'ECR repositories')
+    
+    return resources
+
+
+def _scan_lambda(agent_name_pattern, region):
+    """Find Lambda functions created for AgentCore Runtime deployments."""
+    resources = []
     
-    # Check Lambda functions
     try:
-        lambda_client = boto3.client('lambda', region_name=region)
-        response = lambda_client.list_functions()
+        lambda_client = _client('lambda', region)
+        paginator = lambda_client.get_paginator('list_functions')
+        matches = _name_matcher('agentcore-runtime', agent_name_pattern)
         
-        for func in response.get('Functions', []):
-            func_name = func.get('FunctionName', '')
-            if 'agentcore-runtime' in func_name and agent_name_pattern in func_name:
-                resources.append({
-                    'type': 'Lambda Function',
-                    'name': func_name,
-                    'arn': func.get('FunctionArn'),
-                    'created': func.get('LastModified'),
-                    'client': lambda_client,
-                    'delete_method': 'delete_function',
-                    'delete_params': {'FunctionName': func_name}
-                })
+        # Lambda caps ListFunctions at 50 items per page
+        for page in paginator.paginate(PaginationConfig={'PageSize': 50}):
+            for func in page.get('Functions', []):
+                func_name = func.get('FunctionName', '')
+                if matches(func_name):
+                    resources.append(Resource(
+                        type='Lambda Function',
+                        name=func_name,
+                        arn=func.get('FunctionArn'),
+                        created=func.get('LastModified'),
+                        service='lambda',
+                        region=region,
+                        delete_method='delete_function',
+                        delete_params={'FunctionName': func_name}
+                    ))
                 
-    except Exception as e:
-        print(f"⚠️  Could not list Lambda functions: {str(e)}")
+    except ClientError as e:
+        _report_scan_error(e, 'Lambda functions')
+    
+    return resources
+
+
+def _scan_iam(agent_name_pattern, region, path_prefix=DEFAULT_IAM_PATH_PREFIX):
+    """Find IAM execution roles created for AgentCore Runtime deployments."""
+    resources = []
     
-    # Check IAM roles
     try:
-        iam_client = boto3.client('iam', region_name=region)
-        response = iam_client.list_roles()
+        iam_client = _client('iam', region)
+        paginator = iam_client.get_paginator('list_roles')
+        matches = _name_matcher('AgentCoreRuntimeRole', agent_name_pattern)
         
-        for role in response.get('Roles', []):
-            role_name = role.get('RoleName', '')
-            if 'AgentCoreRuntimeRole' in role_name and agent_name_pattern in role_name:
-                resources.append({
-                    'type': 'IAM Role',
-                    'name': role_name,
-                    'arn': role.get('Arn'),
-                    'created': role.get('CreateDate'),
-                    'client': iam_client,
-                    'delete_method': 'delete_role',
-                    'delete_params': {'RoleName': role_name},
-                    'requires_policy_cleanup': True
-                })
+        # IAM is global, so a narrower path prefix is the main lever on scan time
+        pages = paginator.paginate(
+            PathPrefix=path_prefix,
+            PaginationConfig={'PageSize': 1000}
+        )
+        for page in pages:
+            for role in page.get('Roles', []):
+                role_name = role.get('RoleName', '')
+                if matches(role_name):
+                    resources.append(Resource(
+                        type='IAM Role',
+                        name=role_name,
+                        arn=role.get('Arn'),
+                        created=role.get('CreateDate'),
+                        service='iam',
+                        region=region,
+                        delete_method='delete_role',
+                        delete_params={'RoleName': role_name},
+                        requires_policy_cleanup=True
+                    ))
                 
-    except Exception as e:
-        print(f"⚠️  Could not list IAM roles: {str(e)}")
+    except ClientError as e:
+        _report_scan_error(e, 'IAM roles')
+    
+    return resources
+
+
+def _scan_logs(agent_name_pattern, region):
+    """Find CloudWatch log groups created for AgentCore Runtime deployments."""
+    resources = []
     
-    # Check CloudWatch Log Groups
     try:
-        logs_client = boto3.client('logs', region_name=region)
-        response = logs_client.describe_log_groups()
+        logs_client = _client('logs', region)
+        paginator = logs_client.get_paginator('describe_log_groups')
         
-        for log_group in response.get('logGroups', []):
-            log_group_name = log_group.get('logGroupName', '')
-            if 'bedrock-agentcore' in log_group_name and agent_name_pattern in log_group_name:
-                resources.append({
-                    'type': 'CloudWatch Log Group',
-                    'name': log_group_name,
-                    'arn': log_group.get('arn'),
-                    'created': log_group.get('creationTime'),
-                    'client': logs_client,
-                    'delete_method': 'delete_log_group',
-                    'delete_params': {'logGroupName': log_group_name}
-                })
+        # Filter server-side on the AgentCore prefix; only the pattern check runs locally.
+        # CloudWatch Logs caps DescribeLogGroups at 50 items per page
+        pages = paginator.paginate(
+            logGroupNamePrefix=AGENTCORE_LOG_GROUP_PREFIX,
+            PaginationConfig={'PageSize': 50}
+        )
+        for page in pages:
+            for log_group in page.get('logGroups', []):
+                log_group_name = log_group.get('logGroupName', '')
+                if agent_name_pattern in log_group_name:
+                    resources.append(Resource(
+                        type='CloudWatch Log Group',
+                        name=log_group_name,
+                        arn=log_group.get('arn'),
+                        created=log_group.get('creationTime'),
+                        service='logs',
+                        region=region,
+                        delete_method='delete_log_group',
+                        delete_params={'logGroupName': log_group_name}
+                    ))
                 
-    except Exception as e:
-        print(f"⚠️  Could not list CloudWatch Log Groups: {str(e)}")
+    except ClientError as e:
+        _report_scan_error(e, 'CloudWatch Log Groups')
     
     return resources
 
 
-def display_resources(resources):
-    """Display found resources in a formatted way."""
-    if not resources:
-        print("✅ No AgentCore resources found matching the pattern")
+def _resolve_region():
+    """Return the configured AWS region, reporting when none is set."""
+    region = shared_session().region_name
+    
+    if not region:
+        print("❌ AWS region not configured. Please set AWS_DEFAULT_REGION or configure AWS CLI.")
+    
+    return region
+
+
+def verify_aws_credentials(region):
+    """Exit early when the configured AWS credentials cannot be used."""
+    try:
+        identity = _client('sts', region).get_caller_identity()
+    except (ClientError, NoCredentialsError) as e:
+        sys.exit(f"❌ AWS credentials invalid: {str(e)}")
+    
+    print(f"🔑 Using AWS account: {identity.get('Account')}")
+
+
+def iter_agentcore_resources(agent_name_pattern="sbom", iam_path_prefix=DEFAULT_IAM_PATH_PREFIX):
+    """Yield AgentCore-related resources as each service scan finishes."""
+    print(f"🔍 Searching for AgentCore resources matching pattern: '{agent_name_pattern}'")
+    
+    region = _resolve_region()
+    if not region:
         return
     
-    print(f"\n📋 Found {len(resources)} AgentCore resources:")
-    print("="*80)
+    print(f"📍 Searching in region: {region}")
+    
+    # The service scans are independent and I/O-bound, so run them side by side
+    # Results are reported in this order regardless of which scan finishes first
+    scanners = {
+        'ECR': _scan_ecr,
+        'Lambda': _scan_lambda,
+        'IAM': functools.partial(_scan_iam, path_prefix=iam_path_prefix),
+        'CloudWatch Logs': _scan_logs,
+    }
+    
+    with ThreadPoolExecutor(max_workers=len(scanners)) as executor:
+        futures = {
+            executor.submit(scanner, agent_name_pattern, region): service
+            for service, scanner in scanners.items()
+        }
+        
+        for future in futures:
+            try:
+                yield from future.result()
+            except Exception as e:
+                print(f"⚠️  {futures[future]} scan failed: {str(e)}")
+
+
+def list_agentcore_resources(agent_name_pattern="sbom", iam_path_prefix=DEFAULT_IAM_PATH_PREFIX):
+    """List AgentCore-related resources that might cause conflicts."""
+    return list(iter_agentcore_resources(agent_name_pattern, iam_path_prefix))
+
+
+def log_group_resources(log_group_names):
+    """Build deletable log group resources from known names, skipping discovery."""
+    region = _resolve_region()
+    if not region:
+        return []
+    
+    return [
+        Resource(
+            type='CloudWatch Log Group',
+            name=log_group_name,
+            arn=None,
+            created=None,
+            service='logs',
+            region=region,
+            delete_method='delete_log_group',
+            delete_params={'logGroupName': log_group_name}
+        )
+        for log_group_name in log_group_names
+    ]
+
+
+# ARN service -> (resource type, delete method, delete parameter builder, needs policy cleanup)
+_ARN_DELETE_TARGETS = {
+    'ecr': ('ECR Repository', 'delete_repository',
+            lambda name: {'repositoryName': name, 'force': True}, False),
+    'lambda': ('Lambda Function', 'delete_function',
+               lambda name: {'FunctionName': name}, False),
+    'iam': ('IAM Role', 'delete_role',
+            lambda name: {'RoleName': name}, True),
+    'logs': ('CloudWatch Log Group', 'delete_log_group',
+             lambda name: {'logGroupName': name}, False),
+}
+
+
+def _resource_from_arn(arn, region):
+    """Build a deletable resource from a tagged ARN, or None for unsupported types."""
+    # arn:partition:service:region:account:resource
+    parts = arn.split(':', 5)
+    if len(parts) < 6 or parts[2] not in _ARN_DELETE_TARGETS:
+        return None
+    
+    service, resource_id = parts[2], parts[5]
+    
+    if service == 'ecr' and resource_id.startswith('repository/'):
+        name = resource_id[len('repository/'):]
+    elif service == 'lambda' and resource_id.startswith('function:'):
+        name = resource_id[len('function:'):].split(':', 1)[0]
+    elif service == 'iam' and resource_id.startswith('role/'):
+        name = resource_id.rsplit('/', 1)[-1]
+    elif service == 'logs' and resource_id.startswith('log-group:'):
+        name = resource_id[len('log-group:'):]
+        if name.endswith(':*'):
+            name = name[:-2]
+    else:
+        return None
+    
+    resource_type, delete_method, delete_params, requires_policy_cleanup = _ARN_DELETE_TARGETS[service]
+    return Resource(
+        type=resource_type,
+        name=name,
+        arn=arn,
+        created=None,
+        service=service,
+        region=region,
+        delete_method=delete_method,
+        delete_params=delete_params(name),
+        requires_policy_cleanup=requires_policy_cleanup
+    )
+
+
+def iter_tagged_resources(tag_key, tag_value):
+    """Yield resources carrying the given tag, found with a single tagging API scan."""
+    print(f"🔍 Searching for resources tagged {tag_key}={tag_value}")
+    
+    region = _resolve_region()
+    if not region:
+        return
+    
+    print(f"📍 Searching in region: {region}")
+    
+    try:
+        tagging_client = _client('resourcegroupstaggingapi', region)
+        paginator = tagging_client.get_paginator('get_resources')
+        pages = paginator.paginate(
+            TagFilters=[{'Key': tag_key, 'Values': [tag_value]}],
+            ResourcesPerPage=100
+        )
+        
+        for page in pages:
+            for mapping in page.get('ResourceTagMappingList', []):
+                arn = mapping.get('ResourceARN', '')
+                resource = _resource_from_arn(arn, region)
+                if resource:
+                    yield resource
+                else:
+                    print(f"ℹ️  Skipping tagged resource with no cleanup handler: {arn}")
+                
+    except ClientError as e:
+        _report_scan_error(e, 'tagged resources')
+
+
+def _record_event(events, action, resource, **details):
+    """Append a machine-readable event for --output json, if events are being collected."""
+    if events is not None:
+        events.append({'action': action, 'type': resource.type, 'name': resource.name, **details})
+
+
+def display_resources(resources, events=None):
+    """Display resources as they arrive and return them as a list."""
+    displayed = []
     
     for i, resource in enumerate(resources, 1):
-        print(f"{i}. {resource['type']}: {resource['name']}")
-        if resource.get('arn'):
-            print(f"   ARN: {resource['arn']}")
-        if resource.get('created'):
-            print(f"   Created: {resource['created']}")
+        if i == 1:
+            print("\n📋 AgentCore resources:")
+            print("="*80)
+        
+        print(f"{i}. {resource.type}: {resource.name}")
+        if resource.arn:
+            print(f"   ARN: {resource.arn}")
+        if resource.created:
+            print(f"   Created: {resource.created}")
         print()
+        displayed.append(resource)
+        _record_event(events, 'found', resource, arn=resource.arn, created=resource.created)
+    
+    if displayed:
+        print(f"📋 Found {len(displayed)} AgentCore resources")
+    else:
+        print("✅ No AgentCore resources found matching the pattern")
+    
+    return displayed
 
 
-def cleanup_resources(resources, dry_run=True):
-    """Clean up the specified resources."""
-    if not resources:
-        print("✅ No resources to clean up")
-        return True
+def cleanup_resources(resources, dry_run=True, max_workers=MAX_DELETE_WORKERS, events=None):
+    """Clean up the specified resources.
     
+    Accepts any iterable, so deletes can start while discovery is still running.
+    """
     if dry_run:
         print("🔍 DRY RUN MODE - No resources will be deleted")
         print("Run with --execute to actually delete resources")
         print()
     
-    success_count = 0
-    error_count = 0
-    
-    for resource in resources:
-        resource_type = resource['type']
-        resource_name = resource['name']
+    def delete_resource(resource):
+        resource_type = resource.type
+        resource_name = resource.name
         
         try:
             if dry_run:
                 print(f"[DRY RUN] Would delete {resource_type}: {resource_name}")
+                _record_event(events, 'would_delete', resource)
             else:
                 print(f"🗑️  Deleting {resource_type}: {resource_name}")
                 
+                client = _client(resource.service, resource.region)
+                
                 # Handle IAM roles specially (need to detach policies first)
-                if resource.get('requires_policy_cleanup'):
-                    cleanup_iam_role_policies(resource['client'], resource_name)
+                if resource.requires_policy_cleanup:
+                    cleanup_iam_role_policies(client, resource_name)
                 
                 # Delete the resource
-                delete_method = getattr(resource['client'], resource['delete_method'])
-                delete_method(**resource['delete_params'])
+                delete_method = getattr(client, resource.delete_method)
+                delete_method(**resource.delete_params)
                 
                 print(f"✅ Deleted {resource_type}: {resource_name}")
+                _record_event(events, 'deleted', resource)
             
-            success_count += 1
+            return True
+            
+        # Connection failures and timeouts count against this resource only
+        except (ClientError, BotoCoreError) as e:
+            if not dry_run and _error_code(e) in NOT_FOUND_CODES:
+                print(f"ℹ️  {resource_type} already deleted: {resource_name}")
+                _record_event(events, 'already_deleted', resource)
+                return True
             
-        except Exception as e:
             error_message = str(e)
             if dry_run:
                 print(f"[DRY RUN] Would fail to delete {resource_type}: {resource_name} - {error_message}")
             else:
                 print(f"❌ Failed to delete {resource_type}: {resource_name} - {error_message}")
-            error_count += 1
+            _record_event(events, 'failed', resource, error=error_message)
+            return False
+    
+    # Deletes are independent round-trips; throttling is absorbed by BOTO_CONFIG_OPTIONS retries
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(delete_resource, resource) for resource in resources]
+    
+    results = [future.result() for future in futures]
+    if not results:
+        print("✅ No resources to clean up")
+        return True
+    
+    success_count = results.count(True)
+    error_count = results.count(False)
     
     print()
     if dry_run:
@@ -190,26 +483,46 @@ def cleanup_resources(resources, dry_run=True):
 def cleanup_iam_role_policies(iam_client, role_name):
     """Clean up IAM role policies before deleting the role."""
     try:
-        # Detach managed policies
-        attached_policies = iam_client.list_attached_role_policies(RoleName=role_name)
-        for policy in attached_policies.get('AttachedPolicies', []):
-            iam_client.detach_role_policy(
-                RoleName=role_name,
-                PolicyArn=policy['PolicyArn']
-            )
+        attached_arns = [
+            policy['PolicyArn']
+            for page in iam_client.get_paginator('list_attached_role_policies').paginate(RoleName=role_name)
+            for policy in page.get('AttachedPolicies', [])
+        ]
+        inline_names = [
+            policy_name
+            for page in iam_client.get_paginator('list_role_policies').paginate(RoleName=role_name)
+            for policy_name in page.get('PolicyNames', [])
+        ]
         
-        # Delete inline policies
-        inline_policies = iam_client.list_role_policies(RoleName=role_name)
-        for policy_name in inline_policies.get('PolicyNames', []):
-            iam_client.delete_role_policy(
-                RoleName=role_name,
-                PolicyName=policy_name
-            )
+        def detach_managed(policy_arn):
+            iam_client.detach_role_policy(RoleName=role_name, PolicyArn=policy_arn)
+        
+        def delete_inline(policy_name):
+            iam_client.delete_role_policy(RoleName=role_name, PolicyName=policy_name)
+        
+        # Each detach/delete is an independent call; list() surfaces the first failure
+        with ThreadPoolExecutor(max_workers=MAX_DELETE_WORKERS) as executor:
+            list(executor.map(detach_managed, attached_arns))
+            list(executor.map(delete_inline, inline_names))
             
-    except Exception as e:
+    except (ClientError, BotoCoreError) as e:
+        # A role or policy that is already gone needs no further cleanup
+        if _error_code(e) == 'NoSuchEntity':
+            return
         print(f"⚠️  Warning: Could not clean up policies for role {role_name}: {str(e)}")
 
 
+def _positive_int(value):
+    """Parse a command-line count that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     """Main cleanup function."""
     parser = argparse.ArgumentParser(
@@ -221,6 +534,8 @@ Examples:
   python cleanup_deployment.py --execute                 # Actually delete resources
   python cleanup_deployment.py --pattern my-agent        # Search for specific pattern
   python cleanup_deployment.py --pattern sbom --execute  # Delete resources matching 'sbom'
+  python cleanup_deployment.py --tag agent=sbom          # Find resources by tag
+  python cleanup_deployment.py --log-group-names /aws/bedrock-agentcore/runtimes/x --execute
         """
     )
     
@@ -236,17 +551,68 @@ Examples:
         help='Actually delete resources (default is dry run)'
     )
     
+    parser.add_argument(
+        '--yes',
+        action='store_true',
+        help='Skip the confirmation prompt and delete resources as they are discovered (with --execute)'
+    )
+    
+    parser.add_argument(
+        '--log-group-names',
+        help='Comma-separated CloudWatch log group names to delete directly, skipping discovery'
+    )
+    
+    parser.add_argument(
+        '--tag',
+        help='Find resources by tag (KEY=VALUE) with one tagging API scan instead of per-service listings'
+    )
+    
+    parser.add_argument(
+        '--iam-path-prefix',
+        default=DEFAULT_IAM_PATH_PREFIX,
+        help=f'Only scan IAM roles under this path, e.g. /service-role/ (default: {DEFAULT_IAM_PATH_PREFIX})'
+    )
+    
+    parser.add_argument(
+        '--max-workers',
+        type=_positive_int,
+        default=MAX_DELETE_WORKERS,
+        help=f'Maximum number of concurrent delete calls (default: {MAX_DELETE_WORKERS})'
+    )
+    
     parser.add_argument(
         '--region',
         help='AWS region to search in (overrides AWS_DEFAULT_REGION)'
     )
     
+    parser.add_argument(
+        '--output',
+        choices=['text', 'json'],
+        default='text',
+        help='Output format; json writes an event list to stdout and progress to stderr (default: text)'
+    )
+    
     args = parser.parse_args()
     
     # Set region if provided
     if args.region:
         os.environ['AWS_DEFAULT_REGION'] = args.region
     
+    if args.output == 'json':
+        events = []
+        try:
+            # Keep stdout parseable: progress messages go to stderr
+            with contextlib.redirect_stdout(sys.stderr):
+                run_cleanup(args, events)
+        finally:
+            json.dump(events, sys.stdout, default=str)
+            sys.stdout.write('\n')
+    else:
+        run_cleanup(args)
+
+
+def run_cleanup(args, events=None):
+    """Run the cleanup selected by the parsed command line arguments."""
     try:
         print("🧹 AgentCore Resource Cleanup Utility")
         print("="*50)
@@ -256,11 +622,36 @@ Examples:
             print("   Use --execute to actually delete resources")
             print()
         
-        # Find resources
-        resources = list_agentcore_resources(args.pattern)
+        # One identity call up front beats each service scan failing separately
+        region = _resolve_region()
+        if not region:
+            sys.exit(1)
+        verify_aws_credentials(region)
+        
+        # Find resources, unless the caller already named them
+        if args.log_group_names:
+            log_group_names = [name.strip() for name in args.log_group_names.split(',') if name.strip()]
+            resources = log_group_resources(log_group_names)
+        elif args.tag:
+            tag_key, _, tag_value = args.tag.partition('=')
+            resources = iter_tagged_resources(tag_key, tag_value)
+        else:
+            resources = iter_agentcore_resources(args.pattern, args.iam_path_prefix)
+        
+        # Without a confirmation prompt, deletes start as soon as each scan yields
+        if args.execute and args.yes:
+            success = cleanup_resources(
+                resources,
+                dry_run=False,
+                max_workers=args.max_workers,
+                events=events
+            )
+            if success:
+                print("\n🎉 Cleanup completed successfully!")
+            sys.exit(0 if success else 1)
         
         # Display what was found
-        display_resources(resources)
+        resources = display_resources(resources, events)
         
         if resources:
             if args.execute:
@@ -273,14 +664,24 @@ Examples:
                     sys.exit(0)
             
             # Clean up resources
-            success = cleanup_resources(resources, dry_run=not args.execute)
+            success = cleanup_resources(
+                resources,
+                dry_run=not args.execute,
+                max_workers=args.max_workers,
+                events=events
+            )
             
             if success and args.execute:
                 print("\n🎉 Cleanup completed successfully!")
                 print("You can now try deploying your agent again.")
             elif not args.execute:
                 print("\n💡 To actually delete these resources, run:")
-                print(f"   python cleanup_deployment.py --pattern {args.pattern} --execute")
+                if args.log_group_names:
+                    print(f"   python cleanup_deployment.py --log-group-names {args.log_group_names} --execute")
+                elif args.tag:
+                    print(f"   python cleanup_deployment.py --tag {args.tag} --execute")
+                else:
+                    print(f"   python cleanup_deployment.py --pattern {args.pattern} --execute")
         
         sys.exit(0)
         
@@ -6,17 +6,64 @@ established patterns from the reference implementation.
 """
 
 import os
-import boto3
+import json
+import time
 from bedrock_agentcore_starter_toolkit import Runtime
-from boto3.session import Session
-from utils import setup_cognito_user_pool, reauthenticate_user
+from botocore.exceptions import ClientError, NoCredentialsError
+from utils import client_factory, setup_cognito_user_pool, reauthenticate_user, shared_session
 
 # Configuration
 AGENT_NAME = "sbom_security_agent"
 ENTRYPOINT = "sbom_agent.py"
 REQUIREMENTS_FILE = "requirements.txt"
 
-def setup_github_oauth_provider():
+# Region of the shared AWS session, resolved once instead of in every setup step
+REGION = shared_session().region_name
+
+# Let botocore retry throttled control-plane calls with adaptive backoff
+BOTO_CONFIG_OPTIONS = {'retries': {'max_attempts': 10, 'mode': 'adaptive'}}
+
+# Setup clients, built once per region from the shared session
+_client = client_factory(**BOTO_CONFIG_OPTIONS)
+
+# Resolved Cognito settings, reused across runs so setup is not repeated
+DEPLOY_CACHE_FILE = ".agentcore-deploy-cache.json"
+
+def _read_deploy_cache_file():
+    """Read the whole deployment cache file, or an empty cache if unavailable."""
+    try:
+        with open(DEPLOY_CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def load_deploy_cache(region):
+    """Return the cached deployment settings for this region and agent."""
+    return _read_deploy_cache_file().get(f"{region}:{AGENT_NAME}", {})
+
+def save_deploy_cache(region, **entries):
+    """Merge entries into the cached deployment settings for this region and agent."""
+    cache = _read_deploy_cache_file()
+    cache.setdefault(f"{region}:{AGENT_NAME}", {}).update(entries, mtime=time.time())
+    
+    try:
+        with open(DEPLOY_CACHE_FILE, 'w') as f:
+            json.dump(cache, f, indent=2)
+    except OSError as e:
+        print(f"⚠️  Could not write deployment cache: {str(e)}")
+
+def verify_aws_credentials(region=REGION):
+    """Check once that the configured AWS credentials work before any setup step."""
+    try:
+        identity = _client('sts', region).get_caller_identity()
+    except (ClientError, NoCredentialsError) as e:
+        print(f"❌ AWS credentials invalid: {str(e)}")
+        return False
+    
+    print(f"Using AWS account: {identity.get('Account')}")
+    return True
+
+def setup_github_oauth_provider(region=REGION):
     """Set up GitHub OAuth2 credential provider."""
     print("Setting up GitHub OAuth2 credential provider...")
     
@@ -39,29 +86,25 @@ def setup_github_oauth_provider():
     
     try:
         # Initialize AWS clients
-        boto_session = Session()
-        region = boto_session.region_name
-        agentcore_client = boto3.client('bedrock-agentcore-control', region_name=region)
+        agentcore_client = _client('bedrock-agentcore-control', region)
         
         # First, check if the provider already exists
         provider_name = 'github-provider'
         
         try:
-            # Try to get the existing provider
-            existing_providers = agentcore_client.list_oauth2_credential_providers()
+            # Look the provider up by name; absence is reported as ResourceNotFoundException
+            provider = agentcore_client.get_oauth2_credential_provider(name=provider_name)
+            
+            print(f"ℹ️  GitHub OAuth2 provider '{provider_name}' already exists")
+            print(f"   Provider ARN: {provider.get('credentialProviderArn', 'N/A')}")
+            print(f"   Vendor: {provider.get('credentialProviderVendor', 'N/A')}")
+            print(f"   Created: {provider.get('createdTime', 'N/A')}")
+            print("✅ Using existing GitHub OAuth2 provider")
+            return True
             
-            for provider in existing_providers.get('oauth2CredentialProviders', []):
-                if provider.get('name') == provider_name:
-                    print(f"ℹ️  GitHub OAuth2 provider '{provider_name}' already exists")
-                    print(f"   Provider ARN: {provider.get('credentialProviderArn', 'N/A')}")
-                    print(f"   Vendor: {provider.get('credentialProviderVendor', 'N/A')}")
-                    print(f"   Created: {provider.get('createdAt', 'N/A')}")
-                    print("✅ Using existing GitHub OAuth2 provider")
-                    return True
-                    
-        except Exception as list_error:
-            print(f"⚠️  Could not list existing providers: {str(list_error)}")
-            print("   Proceeding to create new provider...")
+        except ClientError as get_error:
+            if get_error.response.get('Error', {}).get('Code') != 'ResourceNotFoundException':
+                raise
         
         # If we get here, the provider doesn't exist, so create it
         print("📝 Creating new GitHub OAuth2 provider...")
@@ -93,11 +136,37 @@ def setup_github_oauth_provider():
             print(f"❌ Failed to create GitHub OAuth2 provider: {error_message}")
             return False
 
-def setup_cognito_auth():
+def _cached_cognito_config(region):
+    """Return the cached Cognito config with a fresh token, or None if it is stale."""
+    cached = load_deploy_cache(region).get("cognito")
+    if not cached:
+        return None
+    
+    try:
+        # One describe call confirms the pool survives; no need to list every pool
+        cognito_client = _client("cognito-idp", region)
+        cognito_client.describe_user_pool(UserPoolId=cached["pool_id"])
+        bearer_token = reauthenticate_user(cached["client_id"])
+    except Exception as e:
+        print(f"ℹ️  Cached Cognito User Pool is no longer usable: {str(e)}")
+        return None
+    
+    return {**cached, "bearer_token": bearer_token}
+
+def setup_cognito_auth(region=REGION):
     """Set up Cognito authentication using the utils.py implementation."""
     print("Setting up Cognito authentication...")
     
     try:
+        # Reuse the pool from a previous run instead of creating a new one
+        cached_config = _cached_cognito_config(region)
+        if cached_config:
+            print("✅ Reusing Cognito User Pool from deployment cache")
+            print(f"Pool ID: {cached_config['pool_id']}")
+            print(f"Client ID: {cached_config['client_id']}")
+            print(f"Discovery URL: {cached_config['discovery_url']}")
+            return cached_config
+        
         # Use the actual Cognito setup from utils.py
         cognito_config = setup_cognito_user_pool()
         
@@ -107,6 +176,13 @@ def setup_cognito_auth():
             print(f"Client ID: {cognito_config['client_id']}")
             print(f"Discovery URL: {cognito_config['discovery_url']}")
             
+            # The bearer token expires, so only the pool identifiers are cached
+            save_deploy_cache(region, cognito={
+                "discovery_url": cognito_config["discovery_url"],
+                "client_id": cognito_config["client_id"],
+                "pool_id": cognito_config["pool_id"]
+            })
+            
             return {
                 "discovery_url": cognito_config["discovery_url"],
                 "client_id": cognito_config["client_id"],
@@ -130,15 +206,11 @@ def setup_cognito_auth():
             "client_id": "example-client-id"
         }
 
-def configure_agentcore_runtime():
+def configure_agentcore_runtime(region=REGION):
     """Configure AgentCore Runtime deployment."""
     print("Configuring AgentCore Runtime deployment...")
     
     try:
-        # Get AWS session and region
-        boto_session = Session()
-        region = boto_session.region_name
-        
         if not region:
             print("❌ AWS region not configured. Please set AWS_DEFAULT_REGION or configure AWS CLI.")
             return False
@@ -146,7 +218,7 @@ def configure_agentcore_runtime():
         print(f"Using AWS region: {region}")
         
         # Set up Cognito (placeholder)
-        cognito_config = setup_cognito_auth()
+        cognito_config = setup_cognito_auth(region)
         
         # Initialize AgentCore Runtime
         agentcore_runtime = Runtime()
@@ -234,6 +306,12 @@ def main():
     if auto_update_on_conflict:
         print("🔄 Auto-update on conflict mode enabled")
     
+    if not REGION:
+        raise SystemExit("❌ AWS region not configured. Please set AWS_DEFAULT_REGION or configure AWS CLI.")
+    
+    if not verify_aws_credentials():
+        return False
+    
     print("🚀 Starting SBOM Security Agent deployment...")
     print("="*60)
     
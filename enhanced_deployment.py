@@ -8,75 +8,260 @@ redeployment scenarios and conflicts.
 
 import os
 import sys
+import re
 import argparse
-import boto3
-from bedrock_agentcore_starter_toolkit import Runtime
-from boto3.session import Session
-from utils import setup_cognito_user_pool, reauthenticate_user
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from botocore.exceptions import ClientError
+from utils import client_factory, setup_cognito_user_pool, shared_session
 
 # Configuration
 AGENT_NAME = "sbom_security_agent"
 ENTRYPOINT = "sbom_agent.py"
 REQUIREMENTS_FILE = "requirements.txt"
 
+# Upper bound on concurrent AWS calls from the manager's worker pools
+DEFAULT_AWS_CONCURRENCY = 10
+
+
+def _concurrency_from_env(default=DEFAULT_AWS_CONCURRENCY):
+    """Read AWS_MAX_CONCURRENCY, falling back to the default if unset or not an integer."""
+    value = os.getenv('AWS_MAX_CONCURRENCY')
+    try:
+        limit = int(value) if value else default
+    except ValueError:
+        print(f"⚠️  Ignoring AWS_MAX_CONCURRENCY={value!r}: not an integer, using {default}")
+        limit = default
+    # Worker pools and the connection pool need at least one slot
+    return max(limit, 1)
+
+
+MAX_AWS_CONCURRENCY = _concurrency_from_env()
+
+# Client settings shared by every client the manager builds: a keep-alive
+# connection pool as wide as the worker pools, timeouts sized for quick
+# control-plane calls, and adaptive retries for throttled ones. Kept as plain
+# options so botocore.config only loads once a client is needed.
+BOTO_CONFIG_OPTIONS = {
+    'max_pool_connections': MAX_AWS_CONCURRENCY,
+    'tcp_keepalive': True,
+    'connect_timeout': 5,
+    'read_timeout': 30,
+    'retries': {'mode': 'adaptive', 'max_attempts': 5},
+}
+
+# Static multi-line messages, written with a single call each
+CONFLICT_OPTIONS_TEXT = """
+💡 Conflict Resolution Options:
+1. Use --auto-update to update existing resources
+2. Use --force-recreate to redeploy over them in place without prompting
+3. Use --agent-name to deploy with a different name
+4. Manually clean up conflicting resources in AWS console"""
+
+NEXT_STEPS_TEXT = """🎉 SBOM Security Agent deployment completed successfully!
+
+Next steps:
+1. Test the agent: python test_deployment.py
+2. Find agent info: python get_agent_info.py
+3. Configure monitoring and logging
+4. Set up CI/CD pipeline for updates"""
+
+# Error messages that indicate a resource already exists; one case-insensitive pass
+_ALREADY_EXISTS_RE = re.compile(r'already exists', re.IGNORECASE)
+_CONFLICT_RE = re.compile(
+    r'already exists|conflict|duplicate|resourceconflictexception', re.IGNORECASE
+)
+
+# AWS error codes that mean a deployment resource already exists
+_CONFLICT_CODES = frozenset({
+    'ConflictException',
+    'ResourceConflictException',
+    'AlreadyExistsException',
+    'EntityAlreadyExists',
+    'RepositoryAlreadyExistsException',
+})
+
+
+def _is_conflict(error, pattern=_CONFLICT_RE):
+    """Tell whether an error means the resource already exists."""
+    # AWS errors carry a structured code; some services only say so in the message
+    if isinstance(error, ClientError):
+        if error.response.get('Error', {}).get('Code', '') in _CONFLICT_CODES:
+            return True
+    return pattern.search(str(error)) is not None
+
+
+# Clients shared by every manager, built once per region from the shared session
+_shared_client = client_factory(**BOTO_CONFIG_OPTIONS)
+
 
 class DeploymentManager:
     """Manages deployment with conflict resolution capabilities."""
     
+    # Existence probes: (service, method, not-found exception, name attribute,
+    # request parameter builder, artifact label). AgentCore Runtime creates all three.
+    _PROBES = (
+        ('ecr', 'describe_repositories', 'RepositoryNotFoundException',
+         'repo_name', lambda name: {'repositoryNames': [name]},
+         'ECR repository'),
+        ('iam', 'get_role', 'NoSuchEntityException',
+         'role_name', lambda name: {'RoleName': name},
+         'IAM role'),
+        # get_function_configuration skips generating a pre-signed code URL
+        ('lambda', 'get_function_configuration', 'ResourceNotFoundException',
+         'function_name', lambda name: {'FunctionName': name},
+         'Lambda function'),
+    )
+    
+    # Interactive choices for existing artifacts: key -> (menu label, handler method)
+    _MENU = {
+        '1': ("Update existing deployment (recommended)", '_choose_update'),
+        '2': ("Force recreate (redeploy over the existing agent in place)", '_choose_recreate'),
+        '3': ("Cancel deployment", '_choose_cancel'),
+        '4': ("Deploy with a different name", '_choose_rename'),
+    }
+    
+    # Answers accepted as "yes" at confirmation prompts
+    _YES_ANSWERS = frozenset({'y', 'yes', '1', 'true'})
+    
     def __init__(self, agent_name=AGENT_NAME, auto_update=False, force_recreate=False):
         self.agent_name = agent_name
         self.auto_update = auto_update
         self.force_recreate = force_recreate
-        self.boto_session = Session()
-        self.region = self.boto_session.region_name
-        self.agentcore_client = boto3.client('bedrock-agentcore-control', region_name=self.region)
+        self._existing_providers = {}
+        self._pending = {}
+        self.provider_name = 'github-provider'
+        self._refresh_names()
     
-    def check_existing_deployment(self):
-        """Check if there are existing deployment artifacts."""
-        print("🔍 Checking for existing deployment artifacts...")
-        
-        existing_artifacts = []
+    def _refresh_names(self):
+        """Derive the AgentCore resource names from the current agent name."""
+        # Drop the cached form so it is recomputed from the current name
+        self.__dict__.pop('_normalized_name', None)
+        self.repo_name = f"agentcore-runtime-{self._normalized_name}"
+        self.role_name = f"AgentCoreRuntimeRole-{self.agent_name}"
+        self.function_name = self.repo_name
+    
+    # Session, region and control-plane client load lazily, so a manager that
+    # never reaches an AWS step never walks the credential chain
+    @functools.cached_property
+    def boto_session(self):
+        """AWS session shared by every client this manager creates."""
+        return shared_session()
+    
+    @functools.cached_property
+    def region(self):
+        """Region resolved from the session configuration."""
+        return self.boto_session.region_name
+    
+    @functools.cached_property
+    def agentcore_client(self):
+        """Bedrock AgentCore control-plane client."""
+        return self._get_client('bedrock-agentcore-control')
+    
+    @functools.cached_property
+    def _normalized_name(self):
+        """Agent name in the lowercase, dash-separated form used for resource names."""
+        return self.agent_name.lower().replace('_', '-')
+    
+    def _get_client(self, service_name):
+        """Return the shared client for a service in this manager's region."""
+        return _shared_client(service_name, self.region)
+    
+    def _probe(self, service_name, method, not_found, name_attr, build_params, label, log=print):
+        """Return a description of the resource if it exists, otherwise None."""
+        name = getattr(self, name_attr)
         
-        # Check for ECR repository
         try:
-            ecr_client = boto3.client('ecr', region_name=self.region)
-            repo_name = f"agentcore-runtime-{self.agent_name.lower().replace('_', '-')}"
+            client = self._get_client(service_name)
             
             try:
-                ecr_client.describe_repositories(repositoryNames=[repo_name])
-                existing_artifacts.append(f"ECR repository: {repo_name}")
-            except ecr_client.exceptions.RepositoryNotFoundException:
+                getattr(client, method)(**build_params(name))
+                return f"{label}: {name}"
+            except getattr(client.exceptions, not_found):
                 pass
         except Exception as e:
-            print(f"⚠️  Could not check ECR repositories: {str(e)}")
+            log(f"⚠️  Could not check {label} {name}: {str(e)}")
         
-        # Check for IAM role
-        try:
-            iam_client = boto3.client('iam', region_name=self.region)
-            role_name = f"AgentCoreRuntimeRole-{self.agent_name}"
-            
-            try:
-                iam_client.get_role(RoleName=role_name)
-                existing_artifacts.append(f"IAM role: {role_name}")
-            except iam_client.exceptions.NoSuchEntityException:
-                pass
-        except Exception as e:
-            print(f"⚠️  Could not check IAM roles: {str(e)}")
+        return None
+    
+    def _iter_agent_runtimes(self):
+        """Yield AgentCore runtimes page by page, fetching each page only when needed."""
+        paginator = self.agentcore_client.get_paginator('list_agent_runtimes')
         
-        # Check for Lambda function (AgentCore Runtime creates these)
+        # The API has no name filter, so take the largest pages it allows
+        for page in paginator.paginate(PaginationConfig={'PageSize': 100}):
+            yield from page.get('agentRuntimes', ())
+    
+    def _find_existing_runtime(self):
+        """Return the AgentCore runtime named after the agent, or None."""
+        target = self.agent_name.lower()
+        # Stops paging at the first match
+        return next(
+            (runtime for runtime in self._iter_agent_runtimes()
+             if runtime.get('agentRuntimeName', '').lower() == target),
+            None
+        )
+    
+    def _probe_runtime(self, log=print):
+        """Return a description of the agent's AgentCore runtime if it exists, otherwise None."""
         try:
-            lambda_client = boto3.client('lambda', region_name=self.region)
-            function_name = f"agentcore-runtime-{self.agent_name.lower().replace('_', '-')}"
-            
-            try:
-                lambda_client.get_function(FunctionName=function_name)
-                existing_artifacts.append(f"Lambda function: {function_name}")
-            except lambda_client.exceptions.ResourceNotFoundException:
-                pass
+            runtime = self._find_existing_runtime()
         except Exception as e:
-            print(f"⚠️  Could not check Lambda functions: {str(e)}")
+            log(f"⚠️  Could not check AgentCore runtime {self.agent_name}: {str(e)}")
+            return None
+        
+        if runtime:
+            return f"AgentCore runtime: {runtime['agentRuntimeName']} ({runtime.get('status', 'Unknown')})"
+        return None
+    
+    def _build_probe_clients(self):
+        """Create the probe clients up front so worker threads only reuse them."""
+        for probe in self._PROBES:
+            self._get_client(probe[0])
+        self.agentcore_client
+    
+    def _start_preflight(self, executor):
+        """Start the read-only lookups the deployment needs in the background."""
+        # Clients are built here so the worker threads only reuse them
+        self.agentcore_client
+        self._pending['provider'] = (executor.submit(self._find_existing_provider, self.provider_name), ())
+        
+        # Update and recreate modes proceed whatever is found, so only probe
+        # when the user may need to choose
+        if not (self.force_recreate or self.auto_update):
+            self._build_probe_clients()
+            # Held back until deploy_agent() uses the result, so nothing is
+            # printed over the prompts of the steps before it
+            messages = []
+            self._pending['artifacts'] = (
+                executor.submit(self.check_existing_deployment, messages.append), messages
+            )
+    
+    def _preflight_result(self, key, lookup):
+        """Return a pre-flight result, waiting on it if it was started, else run lookup now."""
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return lookup()
+        
+        future, messages = pending
+        result = future.result()
+        for message in messages:
+            print(message)
+        return result
+    
+    def check_existing_deployment(self, log=print):
+        """Check if there are existing deployment artifacts."""
+        log("🔍 Checking for existing deployment artifacts...")
         
-        return existing_artifacts
+        self._build_probe_clients()
+        
+        # The probes are independent round-trips, so overlap their latency
+        with ThreadPoolExecutor(max_workers=min(len(self._PROBES) + 1, MAX_AWS_CONCURRENCY)) as executor:
+            futures = [executor.submit(self._probe, *probe, log=log) for probe in self._PROBES]
+            futures.append(executor.submit(self._probe_runtime, log))
+            results = [future.result() for future in futures]
+        
+        return [artifact for artifact in results if artifact]
     
     def handle_existing_artifacts(self, existing_artifacts):
         """Handle existing deployment artifacts."""
@@ -90,7 +275,7 @@ class DeploymentManager:
         print()
         
         if self.force_recreate:
-            print("🔄 Force recreate mode: AgentCore Runtime will handle cleanup...")
+            print("🔄 Force recreate mode: the existing agent will be redeployed in place...")
             return True
         
         elif self.auto_update:
@@ -100,81 +285,111 @@ class DeploymentManager:
         else:
             # Interactive mode
             print("❓ Existing deployment artifacts found. What would you like to do?")
-            print("1. Update existing deployment (recommended)")
-            print("2. Force recreate (AgentCore Runtime will handle cleanup)")
-            print("3. Cancel deployment")
-            print("4. Deploy with a different name")
+            for key, (label, _) in self._MENU.items():
+                print(f"{key}. {label}")
             
             while True:
                 choice = input("Enter your choice (1-4): ").strip()
+                entry = self._MENU.get(choice)
                 
-                if choice == '1':
-                    print("🔄 Proceeding with update mode...")
-                    self.auto_update = True
-                    return True
-                elif choice == '2':
-                    print("🔄 Proceeding with force recreate mode...")
-                    self.force_recreate = True
-                    return True
-                elif choice == '3':
-                    print("❌ Deployment cancelled by user")
-                    return False
-                elif choice == '4':
-                    new_name = input("Enter new agent name: ").strip()
-                    if new_name:
-                        self.agent_name = new_name
-                        print(f"🔄 Using new agent name: {new_name}")
-                        return True
-                    else:
-                        print("❌ Invalid agent name")
-                        continue
-                else:
+                if entry is None:
                     print("❌ Invalid choice. Please enter 1, 2, 3, or 4.")
+                    continue
+                
+                # Handlers return True/False to finish, or None to ask again
+                result = getattr(self, entry[1])()
+                if result is not None:
+                    return result
     
-
+    def _choose_update(self):
+        """Switch to update mode and continue."""
+        print("🔄 Proceeding with update mode...")
+        self.auto_update = True
+        return True
+    
+    def _choose_recreate(self):
+        """Switch to force recreate mode and continue."""
+        print("🔄 Proceeding with force recreate mode...")
+        self.force_recreate = True
+        return True
+    
+    def _choose_cancel(self):
+        """Stop the deployment."""
+        print("❌ Deployment cancelled by user")
+        return False
+    
+    def _choose_rename(self):
+        """Prompt for a different agent name; None asks for a choice again."""
+        new_name = input("Enter new agent name: ").strip()
+        if not new_name:
+            print("❌ Invalid agent name")
+            return None
+        
+        self.agent_name = new_name
+        self._refresh_names()
+        print(f"🔄 Using new agent name: {new_name}")
+        return True
+    
+    def _find_existing_provider(self, provider_name):
+        """Return the OAuth2 provider with this name, or None; results are memoized."""
+        if provider_name not in self._existing_providers:
+            # A direct lookup by name costs one call however many providers exist
+            try:
+                found = self.agentcore_client.get_oauth2_credential_provider(name=provider_name)
+            except ClientError as e:
+                if e.response.get('Error', {}).get('Code') != 'ResourceNotFoundException':
+                    raise
+                found = None
+            
+            self._existing_providers[provider_name] = found
+        
+        return self._existing_providers[provider_name]
     
     def setup_github_oauth_provider(self):
         """Set up GitHub OAuth2 credential provider with conflict handling."""
         print("Setting up GitHub OAuth2 credential provider...")
         
-        github_client_id = os.getenv("GITHUB_CLIENT_ID")
-        github_client_secret = os.getenv("GITHUB_CLIENT_SECRET")
-        
-        if not github_client_id or not github_client_secret:
-            print("⚠️  GitHub OAuth credentials not found in environment variables.")
-            print("Please set GITHUB_CLIENT_ID and GITHUB_CLIENT_SECRET before deployment.")
-            return False
+        provider_name = self.provider_name
         
         try:
-            provider_name = 'github-provider'
             
             # Check if provider already exists
             try:
-                existing_providers = self.agentcore_client.list_oauth2_credential_providers()
-                
-                for provider in existing_providers.get('oauth2CredentialProviders', []):
-                    if provider.get('name') == provider_name:
-                        print(f"ℹ️  GitHub OAuth2 provider '{provider_name}' already exists")
-                        
-                        if self.auto_update or self.force_recreate:
-                            print("🔄 Updating existing OAuth2 provider...")
-                            # Note: AgentCore may not support updating providers
-                            # In that case, we'll use the existing one
+                existing = self._preflight_result(
+                    'provider', lambda: self._find_existing_provider(provider_name)
+                )
+                if existing:
+                    print(f"ℹ️  GitHub OAuth2 provider '{provider_name}' already exists")
+                    
+                    if self.auto_update or self.force_recreate:
+                        print("🔄 Updating existing OAuth2 provider...")
+                        # Note: AgentCore may not support updating providers
+                        # In that case, we'll use the existing one
+                        print("✅ Using existing GitHub OAuth2 provider")
+                        return True
+                    else:
+                        use_existing = input("Use existing GitHub OAuth2 provider? (y/n): ").strip().lower()
+                        if use_existing in self._YES_ANSWERS:
                             print("✅ Using existing GitHub OAuth2 provider")
                             return True
                         else:
-                            use_existing = input("Use existing GitHub OAuth2 provider? (y/n): ").strip().lower()
-                            if use_existing in ['y', 'yes', '1', 'true']:
-                                print("✅ Using existing GitHub OAuth2 provider")
-                                return True
-                            else:
-                                print("❌ Cannot proceed without OAuth2 provider")
-                                return False
+                            print("❌ Cannot proceed without OAuth2 provider")
+                            return False
                         
             except Exception as list_error:
                 print(f"⚠️  Could not list existing providers: {str(list_error)}")
                 print("   Proceeding to create new provider...")
             
+            # The GitHub credentials are only needed when a provider must be created
+            github_client_id, github_client_secret = map(
+                os.getenv, ("GITHUB_CLIENT_ID", "GITHUB_CLIENT_SECRET")
+            )
+            
+            if not github_client_id or not github_client_secret:
+                print("⚠️  GitHub OAuth credentials not found in environment variables.")
+                print("Please set GITHUB_CLIENT_ID and GITHUB_CLIENT_SECRET before deployment.")
+                return False
+            
             # Create new provider
             print("📝 Creating new GitHub OAuth2 provider...")
             response = self.agentcore_client.create_oauth2_credential_provider(
@@ -195,7 +410,7 @@ class DeploymentManager:
         except Exception as e:
             error_message = str(e)
             
-            if "already exists" in error_message.lower():
+            if _is_conflict(e, _ALREADY_EXISTS_RE):
                 print(f"ℹ️  GitHub OAuth2 provider '{provider_name}' already exists")
                 print("✅ Using existing GitHub OAuth2 provider")
                 return True
@@ -243,6 +458,9 @@ class DeploymentManager:
             
             print(f"Using AWS region: {self.region}")
             
+            # Imported here so --help and argument errors skip loading the toolkit
+            from bedrock_agentcore_starter_toolkit import Runtime
+            
             # Initialize AgentCore Runtime
             agentcore_runtime = Runtime()
             
@@ -274,24 +492,30 @@ class DeploymentManager:
         print("Deploying SBOM Security Agent to AgentCore Runtime...")
         
         try:
-            # Check for existing deployment artifacts
-            existing_artifacts = self.check_existing_deployment()
-            
-            if existing_artifacts:
-                if not self.handle_existing_artifacts(existing_artifacts):
-                    return False
+            # Update and recreate modes proceed whatever is found, so only probe
+            # when the user may need to choose
+            if not (self.force_recreate or self.auto_update):
+                existing_artifacts = self._preflight_result('artifacts', self.check_existing_deployment)
+                
+                if existing_artifacts:
+                    if not self.handle_existing_artifacts(existing_artifacts):
+                        return False
             
-            # Configure deployment options based on conflict resolution mode
+            # Configure deployment options based on conflict resolution mode.
+            # Both modes let launch() turn a create conflict into an in-place
+            # update of the existing runtime, rather than a delete and re-create.
+            replace_existing = self.force_recreate or self.auto_update
             if self.force_recreate:
-                print("🔄 Force recreate mode: AgentCore Runtime will clean up existing resources")
-                # AgentCore Runtime handles cleanup automatically
+                print("🔄 Force recreate mode: an existing agent will be updated in place with this build")
             elif self.auto_update:
                 print("🔄 Auto-update mode: AgentCore Runtime will update existing resources")
-                # AgentCore Runtime handles updates automatically
             
-            # Launch the agent
+            # Launch the agent. This runs in-process on the main thread: the
+            # configured Runtime holds its state in memory, and by this point
+            # every pre-flight lookup has been consumed, so nothing else is
+            # using the AWS session.
             print("🚀 Launching agent deployment...")
-            launch_result = agentcore_runtime.launch()
+            launch_result = agentcore_runtime.launch(auto_update_on_conflict=replace_existing)
             
             print("✅ SBOM Security Agent deployed successfully!")
             print(f"Deployment result: {launch_result}")
@@ -299,94 +523,95 @@ class DeploymentManager:
             return launch_result
             
         except Exception as e:
-            error_message = str(e)
+            return self._report_deploy_failure(str(e), _is_conflict(e))
+    
+    def _report_deploy_failure(self, error_message, is_conflict):
+        """Explain a failed launch and return False."""
+        if is_conflict:
+            print(f"⚠️  Deployment conflict detected: {error_message}")
             
-            # Handle specific conflict errors
-            if ("already exists" in error_message.lower() or 
-                "conflict" in error_message.lower() or
-                "duplicate" in error_message.lower() or
-                "resourceconflictexception" in error_message.lower()):
-                
-                print(f"⚠️  Deployment conflict detected: {error_message}")
-                
-                if self.auto_update or self.force_recreate:
-                    print("🔄 Conflict resolution mode enabled, but AgentCore Runtime still failed")
-                    print("💡 This might be a resource that needs manual cleanup")
-                    print("💡 Try using a different agent name with --agent-name")
-                else:
-                    print("\n💡 Conflict Resolution Options:")
-                    print("1. Use --auto-update to update existing resources")
-                    print("2. Use --force-recreate to clean up and recreate")
-                    print("3. Use --agent-name to deploy with a different name")
-                    print("4. Manually clean up conflicting resources in AWS console")
-                
-                return False
+            if self.auto_update or self.force_recreate:
+                print("🔄 Conflict resolution mode enabled, but AgentCore Runtime still failed")
+                print("💡 This might be a resource that needs manual cleanup")
+                print("💡 Try using a different agent name with --agent-name")
             else:
-                print(f"❌ Failed to deploy agent: {error_message}")
-                return False
+                print(CONFLICT_OPTIONS_TEXT)
+        else:
+            print(f"❌ Failed to deploy agent: {error_message}")
+        
+        return False
     
     def deploy(self):
         """Main deployment method."""
-        print(f"🚀 Starting SBOM Security Agent deployment...")
-        print(f"   Agent Name: {self.agent_name}")
-        print(f"   Auto Update: {self.auto_update}")
-        print(f"   Force Recreate: {self.force_recreate}")
-        print("="*60)
-        
-        # Step 1: Set up GitHub OAuth2 provider
-        if not self.setup_github_oauth_provider():
-            print("❌ GitHub OAuth2 setup failed. Deployment cannot continue.")
-            return False
-        
-        print()
-        
-        # Step 2: Set up Cognito authentication
-        cognito_config = self.setup_cognito_auth()
-        
-        print()
-        
-        # Step 3: Configure AgentCore Runtime
-        agentcore_runtime = self.configure_runtime(cognito_config)
-        if not agentcore_runtime:
-            print("❌ AgentCore Runtime configuration failed. Deployment cannot continue.")
-            return False
-        
-        print()
+        print(
+            "🚀 Starting SBOM Security Agent deployment...\n"
+            f"   Agent Name: {self.agent_name}\n"
+            f"   Auto Update: {self.auto_update}\n"
+            f"   Force Recreate: {self.force_recreate}\n"
+            + "="*60
+        )
         
-        # Step 4: Deploy agent
-        deployment_result = self.deploy_agent(agentcore_runtime)
-        if not deployment_result:
-            print("❌ Agent deployment failed.")
-            return False
+        # The provider lookup and artifact probes are read-only and independent
+        # of each other, so both start at once and overlap steps 1-3. Cognito
+        # setup creates resources and so stays behind a successful provider step.
+        executor = ThreadPoolExecutor(max_workers=2)
+        try:
+            self._start_preflight(executor)
+            
+            # Step 1: Set up GitHub OAuth2 provider
+            if not self.setup_github_oauth_provider():
+                print("❌ GitHub OAuth2 setup failed. Deployment cannot continue.")
+                return False
+            
+            print()
+            
+            # Step 2: Set up Cognito authentication
+            cognito_config = self.setup_cognito_auth()
+            
+            print()
+            
+            # Step 3: Configure AgentCore Runtime
+            agentcore_runtime = self.configure_runtime(cognito_config)
+            if not agentcore_runtime:
+                print("❌ AgentCore Runtime configuration failed. Deployment cannot continue.")
+                return False
+            
+            print()
+            
+            # Step 4: Deploy agent
+            deployment_result = self.deploy_agent(agentcore_runtime)
+            if not deployment_result:
+                print("❌ Agent deployment failed.")
+                return False
+        finally:
+            # After an early return, drop the lookups nobody will use rather
+            # than wait for them
+            self._pending.clear()
+            executor.shutdown(wait=False, cancel_futures=True)
         
         print()
         print("="*60)
-        print("🎉 SBOM Security Agent deployment completed successfully!")
-        print()
-        print("Next steps:")
-        print("1. Test the agent: python test_deployment.py")
-        print("2. Find agent info: python get_agent_info.py")
-        print("3. Configure monitoring and logging")
-        print("4. Set up CI/CD pipeline for updates")
+        print(NEXT_STEPS_TEXT)
         
         return True
 
 
-def main():
-    """Main function with command line argument support."""
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    """Build the command line parser once; repeated main() calls reuse it."""
     parser = argparse.ArgumentParser(
         description="Deploy SBOM Security Agent with conflict resolution",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Conflict Resolution Options:
   --auto-update         Automatically update existing agents instead of failing
-  --force-recreate      Delete and recreate existing agents
+  --force-recreate      Redeploy over existing agents in place without prompting
   --agent-name NAME     Use a different agent name to avoid conflicts
 
 Examples:
   python enhanced_deployment.py                    # Interactive deployment
   python enhanced_deployment.py --auto-update     # Auto-update existing agents
-  python enhanced_deployment.py --force-recreate  # Delete and recreate
+  python enhanced_deployment.py --force-recreate  # Redeploy in place without prompting
   python enhanced_deployment.py --agent-name my-agent  # Use different name
         """
     )
@@ -400,7 +625,7 @@ Examples:
     parser.add_argument(
         '--force-recreate',
         action='store_true',
-        help='Delete and recreate existing agents (destructive operation)'
+        help='Redeploy over existing agents in place without prompting (same launch as --auto-update)'
     )
     
     parser.add_argument(
@@ -414,7 +639,12 @@ Examples:
         help='AWS region to deploy to (overrides AWS_DEFAULT_REGION)'
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main function with command line argument support."""
+    args = _build_parser().parse_args()
     
     # Set region if provided
     if args.region:
@@ -8,6 +8,7 @@ for use in scripts or quick lookups.
 
 import sys
 import os
+import argparse
 
 # Add the current directory to Python path to import get_agent_info
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -21,6 +22,13 @@ except ImportError:
 
 def main():
     """Find and display the agent endpoint URL."""
+    parser = argparse.ArgumentParser(description="Find the SBOM Security Agent endpoint URL")
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help="Always query AWS instead of using get_agent_info's discovery cache"
+    )
+    args = parser.parse_args()
     
     # Try environment variables first
     endpoint = os.getenv('AGENT_ENDPOINT')
@@ -36,7 +44,7 @@ def main():
     
     # Try AWS API
     print("Searching AWS for your agent...", file=sys.stderr)
-    agent_info = find_agent_info("sbom-security-agent")
+    agent_info = find_agent_info("sbom-security-agent", use_cache=not args.no_cache)
     
     if agent_info and agent_info.get('endpoint_url'):
         print(agent_info['endpoint_url'])
@@ -13,213 +13,339 @@ Usage:
     python get_agent_info.py --help       # Show help
 """
 
-import boto3
 import json
 import os
 import sys
+import time
 import argparse
-from boto3.session import Session
+import shutil
+import tempfile
+import functools
+import re
+from concurrent.futures import ThreadPoolExecutor
+from utils import client_factory, shared_session, validate_endpoint_url
 
+# Standard AgentCore endpoint URL, with or without scheme and /invocations
+_ENDPOINT_RE = re.compile(
+    r'^(?P<scheme>https?://)?(?P<agent_id>[a-z0-9_-]+)\.bedrock-agentcore\.'
+    r'(?P<region>[a-z0-9-]+)\.amazonaws\.com(?:/invocations)?/?$',
+    re.IGNORECASE
+)
 
-def find_agent_info(agent_name="sbom-security-agent"):
-    """Find information about the deployed agent."""
-    print(f"🔍 Looking for agent: {agent_name}")
+# Agent looked up when no --agent-name is given
+DEFAULT_AGENT_NAME = 'sbom-security-agent'
+
+# Variables naming the agent an endpoint saved in .env belongs to
+AGENT_NAME_ENV_VARS = ('AGENT_NAME', 'DEPLOYED_AGENT_NAME')
+
+# Environment variables that may hold the agent endpoint, in priority order
+ENDPOINT_ENV_VARS = (
+    'AGENT_ENDPOINT', 'AGENTCORE_ENDPOINT', 'BEDROCK_AGENT_ENDPOINT',
+    'AGENT_URL', 'INVOKE_URL', 'ENDPOINT_URL'
+)
+
+# Variables save_agent_info_to_env() owns in .env
+MANAGED_ENV_KEYS = frozenset({
+    'AGENT_ENDPOINT', 'AGENT_ID', 'AGENT_NAME', 'AWS_REGION',
+    'COGNITO_CLIENT_ID', 'COGNITO_POOL_ID', 'COGNITO_DISCOVERY_URL'
+})
+
+# Discovery results are cached here between runs, keyed by lookup and region
+CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "sbom_agent_info.json")
+CACHE_TTL_SECONDS = 300
+
+# Client settings for the short discovery calls: fail fast on a stalled
+# connection, reuse keep-alive connections across the concurrent probes, and
+# retry throttled calls adaptively
+BOTO_CONFIG_OPTIONS = {
+    'connect_timeout': 3,
+    'read_timeout': 10,
+    'tcp_keepalive': True,
+    'max_pool_connections': 8,
+    'retries': {'mode': 'adaptive', 'max_attempts': 3},
+}
+
+# Discovery clients, built once per region from the shared session
+_client = client_factory(**BOTO_CONFIG_OPTIONS)
+
+
+def _silent(*args, **kwargs):
+    """Discard progress output; the log callable for quiet runs."""
+
+
+def _read_cache_file():
+    """Return the whole discovery cache, or an empty one if it is missing or unreadable."""
+    try:
+        with open(CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _load_cache(key, ttl=CACHE_TTL_SECONDS):
+    """Return the cached value for key if it is younger than ttl seconds, otherwise None."""
+    entry = _read_cache_file().get(key)
+    if entry and time.time() - entry.get('ts', 0) < ttl:
+        return entry.get('data')
+    return None
+
+
+def _save_cache(key, value, log=print):
+    """Cache a discovery result; written to a temp file and renamed so readers never see a partial file."""
+    cache = _read_cache_file()
+    cache[key] = {'ts': time.time(), 'data': value}
+    
+    cache_dir = os.path.dirname(CACHE_FILE)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', dir=cache_dir, delete=False) as f:
+            json.dump(cache, f)
+        os.replace(f.name, CACHE_FILE)
+    except OSError as e:
+        log(f"⚠️  Could not cache discovery results: {str(e)}")
+
+
+def _normalize_agent_name(agent_name):
+    """Return the agent name in the lowercase, dash-separated form used for resource names."""
+    return agent_name.lower().replace('_', '-')
+
+
+@functools.lru_cache(maxsize=None)
+def find_all_agents(region):
+    """Return every AgentCore runtime in the region, keyed by normalized agent name."""
+    # One paginated listing answers lookups for any number of agent names
+    paginator = _client('bedrock-agentcore-control', region).get_paginator('list_agent_runtimes')
+    
+    agents = {}
+    for page in paginator.paginate(PaginationConfig={'PageSize': 100}):
+        for runtime in page.get('agentRuntimes', []):
+            agents[_normalize_agent_name(runtime['agentRuntimeName'])] = runtime
+    
+    return agents
+
+
+def _probe_agent_runtime(region, agent_name, log=print):
+    """Return the agent's AgentCore runtime summary if it exists, otherwise None."""
+    try:
+        runtime = find_all_agents(region).get(_normalize_agent_name(agent_name))
+    except Exception as e:
+        log(f"⚠️  Could not list AgentCore runtimes: {str(e)}")
+        return None
+    
+    if runtime:
+        log(f"✅ Found AgentCore runtime: {runtime['agentRuntimeName']}")
+    return runtime
+
+
+def _probe_ecr_repository(ecr_client, agent_name, repo_name, log=print):
+    """Return agent details if the ECR repository exists, otherwise None."""
+    try:
+        repo_info = ecr_client.describe_repositories(repositoryNames=[repo_name])
+        if repo_info.get('repositories'):
+            log(f"✅ Found ECR repository: {repo_name}")
+            return {
+                'agentName': agent_name,
+                'repository': repo_name
+            }
+    except ecr_client.exceptions.RepositoryNotFoundException:
+        pass
+    except Exception as e:
+        log(f"⚠️  Could not check ECR repositories: {str(e)}")
+    
+    return None
+
+
+def _probe_lambda_function(lambda_client, agent_name, function_name, log=print):
+    """Return agent details if the Lambda function exists, otherwise None."""
+    try:
+        function_info = lambda_client.get_function(FunctionName=function_name)
+        log(f"✅ Found Lambda function: {function_name}")
+        return {
+            'agentName': agent_name,
+            'functionName': function_name,
+            'functionArn': function_info.get('Configuration', {}).get('FunctionArn')
+        }
+    except lambda_client.exceptions.ResourceNotFoundException:
+        pass
+    except Exception as e:
+        log(f"⚠️  Could not check Lambda functions: {str(e)}")
+    
+    return None
+
+
+def _print_agent_summary(agent_info, log=print):
+    """Print the discovered agent details."""
+    log("\n" + "="*60)
+    log("🎯 AGENT INFORMATION")
+    log("="*60)
+    log(f"Agent Name: {agent_info.get('agent_name') or 'Unknown'}")
+    log(f"Agent ID: {agent_info['agent_id']}")
+    log(f"Status: {agent_info.get('status') or 'Unknown'}")
+    log(f"Region: {agent_info['region']}")
+    log(f"Endpoint URL: {agent_info['endpoint_url']}")
+    log(f"Created: {agent_info.get('created_at') or 'Unknown'}")
+    log(f"Updated: {agent_info.get('updated_at') or 'Unknown'}")
+    log("="*60)
+
+
+def find_agent_info(agent_name=DEFAULT_AGENT_NAME, use_cache=True, log=print):
+    """Find information about the deployed agent; progress goes through log."""
+    log(f"🔍 Looking for agent: {agent_name}")
     
     try:
         # Get AWS session and region
-        boto_session = Session()
-        region = boto_session.region_name
+        region = shared_session().region_name
         
         if not region:
-            print("❌ AWS region not configured. Please set AWS_DEFAULT_REGION or configure AWS CLI.")
+            log("❌ AWS region not configured. Please set AWS_DEFAULT_REGION or configure AWS CLI.")
             return None
         
-        print(f"📍 Searching in region: {region}")
-        
-        # Initialize AgentCore client
-        agentcore_client = boto3.client('bedrock-agentcore-control', region_name=region)
-        
-        print("⚠️  Direct agent listing via AgentCore Control API is not available")
-        print("💡 AgentCore agents are managed through the Runtime toolkit")
-        print("💡 Trying alternative detection methods...")
-        
-        # Try to find agent info from deployment artifacts
-        agent_id = None
-        agent_info = {}
-        
-        # Check for ECR repository (AgentCore Runtime creates these)
-        try:
-            ecr_client = boto3.client('ecr', region_name=region)
-            repo_name = f"agentcore-runtime-{agent_name.lower().replace('_', '-')}"
+        log(f"📍 Searching in region: {region}")
+        
+        cache_key = f"agent:{region}:{agent_name}"
+        if use_cache:
+            cached = _load_cache(cache_key)
+            if cached:
+                log("📦 Using cached agent information (pass --no-cache to refresh)")
+                _print_agent_summary(cached, log)
+                return cached
+        
+        log("💡 Checking AgentCore runtimes and deployment artifacts...")
+        
+        # Try to find agent info from deployment artifacts. AgentCore Runtime
+        # names both after the agent, and the lookups are independent, so
+        # they run concurrently; clients are built here since sessions are
+        # not thread-safe
+        repo_name = f"agentcore-runtime-{_normalize_agent_name(agent_name)}"
+        ecr_client = _client('ecr', region)
+        lambda_client = _client('lambda', region)
+        _client('bedrock-agentcore-control', region)
+        
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            ecr_future = executor.submit(_probe_ecr_repository, ecr_client, agent_name, repo_name, log)
+            lambda_future = executor.submit(_probe_lambda_function, lambda_client, agent_name, repo_name, log)
+            runtime_future = executor.submit(_probe_agent_runtime, region, agent_name, log)
             
-            try:
-                repo_info = ecr_client.describe_repositories(repositoryNames=[repo_name])
-                if repo_info.get('repositories'):
-                    print(f"✅ Found ECR repository: {repo_name}")
-                    # Extract potential agent ID from repository tags or metadata
-                    # This is a best-effort approach
-                    agent_id = repo_name.replace('agentcore-runtime-', '')
-                    agent_info = {
-                        'agentName': agent_name,
-                        'repository': repo_name
-                    }
-            except ecr_client.exceptions.RepositoryNotFoundException:
-                pass
-        except Exception as e:
-            print(f"⚠️  Could not check ECR repositories: {str(e)}")
-        
-        # Check for Lambda function (AgentCore Runtime creates these)
-        if not agent_id:
-            try:
-                lambda_client = boto3.client('lambda', region_name=region)
-                function_name = f"agentcore-runtime-{agent_name.lower().replace('_', '-')}"
-                
-                try:
-                    function_info = lambda_client.get_function(FunctionName=function_name)
-                    print(f"✅ Found Lambda function: {function_name}")
-                    # Extract agent ID from function metadata
-                    agent_id = function_name.replace('agentcore-runtime-', '')
-                    agent_info = {
-                        'agentName': agent_name,
-                        'functionName': function_name,
-                        'functionArn': function_info.get('Configuration', {}).get('FunctionArn')
-                    }
-                except lambda_client.exceptions.ResourceNotFoundException:
-                    pass
-            except Exception as e:
-                print(f"⚠️  Could not check Lambda functions: {str(e)}")
+            # Prefer the ECR repository when both exist
+            agent_info = ecr_future.result() or lambda_future.result() or {}
+            runtime = runtime_future.result()
+        
+        # The runtime listing supplies the status the artifacts lack
+        if runtime:
+            updated_at = runtime.get('lastUpdatedAt')
+            agent_info = {
+                **agent_info,
+                'agentName': agent_info.get('agentName', agent_name),
+                'agentStatus': runtime.get('status'),
+                'updatedAt': str(updated_at) if updated_at else None
+            }
+        
+        # The runtime carries the real agent ID; otherwise extract it from the
+        # artifact name (best-effort approach)
+        if runtime and runtime.get('agentRuntimeId'):
+            agent_id = runtime['agentRuntimeId']
+        else:
+            agent_id = repo_name.replace('agentcore-runtime-', '') if agent_info else None
         
         if not agent_id:
-            print(f"❌ Could not find deployment artifacts for agent '{agent_name}'")
-            print("💡 Make sure the agent has been deployed successfully")
-            print("💡 Try running the deployment script first")
+            log(f"❌ Could not find deployment artifacts for agent '{agent_name}'")
+            log("💡 Make sure the agent has been deployed successfully")
+            log("💡 Try running the deployment script first")
             return None
         
         # Try to construct the endpoint URL
         endpoint_url = f"https://{agent_id}.bedrock-agentcore.{region}.amazonaws.com/invocations"
         
-        print("\n" + "="*60)
-        print("🎯 AGENT INFORMATION")
-        print("="*60)
-        print(f"Agent Name: {agent_info.get('agentName', 'Unknown')}")
-        print(f"Agent ID: {agent_id}")
-        print(f"Status: {agent_info.get('agentStatus', 'Unknown')}")
-        print(f"Region: {region}")
-        print(f"Endpoint URL: {endpoint_url}")
-        print(f"Created: {agent_info.get('createdAt', 'Unknown')}")
-        print(f"Updated: {agent_info.get('updatedAt', 'Unknown')}")
-        
-        # Show runtime information if available
-        if 'agentRuntimeConfig' in agent_info:
-            runtime_config = agent_info['agentRuntimeConfig']
-            print(f"Runtime Status: {runtime_config.get('status', 'Unknown')}")
-            
-        print("="*60)
-        
-        return {
+        result = {
             "agent_id": agent_id,
             "agent_name": agent_info.get('agentName'),
             "endpoint_url": endpoint_url,
             "status": agent_info.get('agentStatus'),
+            "updated_at": agent_info.get('updatedAt'),
             "region": region
         }
         
+        _print_agent_summary(result, log)
+        _save_cache(cache_key, result, log)
+        return result
+        
     except Exception as e:
-        print(f"❌ Error finding agent information: {str(e)}")
-        print("\nTroubleshooting:")
-        print("1. Ensure AWS credentials are configured")
-        print("2. Check that you have AgentCore permissions")
-        print("3. Verify the agent was deployed successfully")
-        print("4. Try running: aws bedrock-agentcore list-agents")
+        log(f"❌ Error finding agent information: {str(e)}")
+        log("\nTroubleshooting:")
+        log("1. Ensure AWS credentials are configured")
+        log("2. Check that you have AgentCore permissions")
+        log("3. Verify the agent was deployed successfully")
+        log("4. Try running: aws bedrock-agentcore list-agents")
         return None
 
 
-def find_cognito_info():
-    """Find Cognito User Pool information."""
-    print("\n🔍 Looking for Cognito User Pool information...")
+def _find_first(client, operation, key, predicate, **kwargs):
+    """Return the first item under key matching predicate, paging only as far as needed."""
+    # 60 is the largest page the Cognito list operations allow
+    paginator = client.get_paginator(operation)
+    for page in paginator.paginate(PaginationConfig={'PageSize': 60}, **kwargs):
+        match = next((item for item in page.get(key, []) if predicate(item)), None)
+        if match:
+            return match
+    
+    return None
+
+
+def find_cognito_info(use_cache=True, log=print):
+    """Find Cognito User Pool information; progress goes through log."""
+    log("\n🔍 Looking for Cognito User Pool information...")
     
     try:
-        boto_session = Session()
-        region = boto_session.region_name
-        cognito_client = boto3.client('cognito-idp', region_name=region)
+        region = shared_session().region_name
+        
+        cache_key = f"cognito:{region}"
+        if use_cache:
+            cached = _load_cache(cache_key)
+            if cached:
+                log(f"📦 Using cached Cognito User Pool: {cached['pool_id']}")
+                return cached
         
-        # List user pools
-        response = cognito_client.list_user_pools(MaxResults=50)
-        user_pools = response.get('UserPools', [])
+        cognito_client = _client('cognito-idp', region)
         
-        # Look for our user pool
-        mcp_pool = None
-        for pool in user_pools:
-            if 'MCPServerPool' in pool.get('Name', ''):
-                mcp_pool = pool
-                break
+        # Look for our user pool, paging until it turns up
+        mcp_pool = _find_first(
+            cognito_client, 'list_user_pools', 'UserPools',
+            lambda pool: 'MCPServerPool' in pool.get('Name', '')
+        )
         
         if mcp_pool:
             pool_id = mcp_pool['Id']
-            print(f"✅ Found Cognito User Pool: {mcp_pool['Name']}")
-            print(f"   Pool ID: {pool_id}")
+            log(f"✅ Found Cognito User Pool: {mcp_pool['Name']}")
+            log(f"   Pool ID: {pool_id}")
             
-            # Get app clients
-            clients_response = cognito_client.list_user_pool_clients(
-                UserPoolId=pool_id,
-                MaxResults=50
+            # Get app clients; take the first one
+            client = _find_first(
+                cognito_client, 'list_user_pool_clients', 'UserPoolClients',
+                lambda client: True, UserPoolId=pool_id
             )
-            
-            clients = clients_response.get('UserPoolClients', [])
-            if clients:
-                client = clients[0]  # Take the first client
+            if client:
                 client_id = client['ClientId']
-                print(f"   Client ID: {client_id}")
+                log(f"   Client ID: {client_id}")
                 
                 discovery_url = f"https://cognito-idp.{region}.amazonaws.com/{pool_id}/.well-known/openid-configuration"
-                print(f"   Discovery URL: {discovery_url}")
+                log(f"   Discovery URL: {discovery_url}")
                 
-                return {
+                cognito_info = {
                     "pool_id": pool_id,
                     "client_id": client_id,
                     "discovery_url": discovery_url
                 }
+                _save_cache(cache_key, cognito_info, log)
+                return cognito_info
         
-        print("❌ MCPServerPool not found")
+        log("❌ MCPServerPool not found")
         return None
         
     except Exception as e:
-        print(f"❌ Error finding Cognito information: {str(e)}")
+        log(f"❌ Error finding Cognito information: {str(e)}")
         return None
 
 
-def validate_endpoint_url(url):
-    """Validate and fix the endpoint URL format."""
-    if not url:
-        return None, "URL cannot be empty"
-    
-    # Remove whitespace
-    url = url.strip()
-    
-    # Add https:// if no protocol is specified
-    if not url.startswith(('http://', 'https://')):
-        url = 'https://' + url
-    
-    # Parse the URL to validate it
-    try:
-        from urllib.parse import urlparse
-        parsed = urlparse(url)
-        if not parsed.netloc:
-            return None, "Invalid URL format"
-        
-        # Ensure it ends with /invocations if it doesn't already
-        if not parsed.path.endswith('/invocations'):
-            if parsed.path and not parsed.path.endswith('/'):
-                url += '/invocations'
-            else:
-                url += 'invocations'
-        
-        return url, None
-        
-    except Exception as e:
-        return None, f"Invalid URL: {str(e)}"
-
-
 def show_endpoint_help():
     """Show detailed help for finding the agent endpoint URL."""
     print("\n" + "="*60)
@@ -248,29 +374,60 @@ def show_endpoint_help():
     print("="*60)
 
 
+def _endpoint_from_agentcore_config(path):
+    """Return the endpoint recorded in a starter toolkit config file, or None."""
+    try:
+        import yaml
+        
+        # Prefer the libyaml parser when PyYAML was built with it
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        with open(path, 'r') as f:
+            config = yaml.load(f, Loader=loader) or {}
+    except Exception as e:
+        print(f"⚠️  Could not read {path}: {str(e)}")
+        return None
+    
+    # Use the default agent, or the only one configured
+    agents = config.get('agents') or {}
+    agent = agents.get(config.get('default_agent')) or next(iter(agents.values()), None)
+    if not agent:
+        return None
+    
+    deployment = agent.get('bedrock_agentcore') or {}
+    agent_id = deployment.get('agent_id')
+    region = (agent.get('aws') or {}).get('region')
+    
+    # Fall back to the ARN: arn:aws:bedrock-agentcore:<region>:<account>:runtime/<agent-id>
+    agent_arn = deployment.get('agent_arn') or ''
+    arn_parts = agent_arn.split(':')
+    if len(arn_parts) == 6:
+        region = region or arn_parts[3]
+        agent_id = agent_id or arn_parts[5].rpartition('/')[2]
+    
+    if agent_id and region:
+        return f"https://{agent_id}.bedrock-agentcore.{region}.amazonaws.com/invocations"
+    return None
+
+
 def try_get_endpoint_from_deployment():
     """Try to get the endpoint URL from recent deployment output."""
-    import os
     try:
-        # Check if there's a .bedrock_agentcore.yaml file (created by starter toolkit)
-        if os.path.exists('.bedrock_agentcore.yaml'):
-            print("📄 Found .bedrock_agentcore.yaml file from deployment")
-            with open('.bedrock_agentcore.yaml', 'r') as f:
-                content = f.read()
-                print("   You can check this file for configuration details")
-        
         # Check for common environment variables
-        possible_env_vars = [
-            'AGENT_ENDPOINT', 'AGENTCORE_ENDPOINT', 'BEDROCK_AGENT_ENDPOINT',
-            'AGENT_URL', 'INVOKE_URL', 'ENDPOINT_URL'
-        ]
-        
-        for var in possible_env_vars:
+        for var in ENDPOINT_ENV_VARS:
             value = os.getenv(var)
             if value:
                 print(f"📍 Found endpoint in environment variable {var}: {value}")
                 return value
         
+        # Check if there's a .bedrock_agentcore.yaml file (created by starter toolkit)
+        if os.path.exists('.bedrock_agentcore.yaml'):
+            print("📄 Found .bedrock_agentcore.yaml file from deployment")
+            endpoint = _endpoint_from_agentcore_config('.bedrock_agentcore.yaml')
+            if endpoint:
+                print(f"📍 Found endpoint in .bedrock_agentcore.yaml: {endpoint}")
+                return endpoint
+            print("   No deployed agent recorded yet; you can check this file for configuration details")
+        
         return None
         
     except Exception as e:
@@ -278,6 +435,36 @@ def try_get_endpoint_from_deployment():
         return None
 
 
+def _endpoint_from_env(agent_name=DEFAULT_AGENT_NAME, env_file='.env'):
+    """Return an endpoint set in the environment or saved in .env for agent_name, without printing."""
+    saved = {}
+    try:
+        with open(env_file, 'r') as f:
+            for line in f:
+                key, sep, value = line.partition('=')
+                if sep and not key.lstrip().startswith('#'):
+                    saved[key.strip()] = value.strip()
+    except OSError:
+        pass
+    
+    # A saved endpoint only answers for the default agent or the agent it was saved for
+    if _normalize_agent_name(agent_name) != _normalize_agent_name(DEFAULT_AGENT_NAME):
+        saved_names = {
+            _normalize_agent_name(name)
+            for name in (os.getenv(var) or saved.get(var) for var in AGENT_NAME_ENV_VARS)
+            if name
+        }
+        if _normalize_agent_name(agent_name) not in saved_names:
+            return None
+    
+    # For each variable, the live environment wins over the saved value
+    for var in ENDPOINT_ENV_VARS:
+        value = os.getenv(var) or saved.get(var)
+        if value:
+            return value
+    return None
+
+
 def get_endpoint_url_from_user():
     """Get and validate endpoint URL from user with helpful guidance."""
     print("\n📍 I need your AgentCore agent endpoint URL.")
@@ -340,13 +527,11 @@ def save_agent_info_to_env(agent_info, cognito_info=None):
             with open('.env', 'r') as f:
                 env_content = f.readlines()
         
-        # Remove existing agent-related variables
-        env_content = [line for line in env_content if not any(
-            line.startswith(var) for var in [
-                'AGENT_ENDPOINT=', 'AGENT_ID=', 'AGENT_NAME=', 'AWS_REGION=',
-                'COGNITO_CLIENT_ID=', 'COGNITO_POOL_ID=', 'COGNITO_DISCOVERY_URL='
-            ]
-        )]
+        # Remove existing agent-related variables; one set lookup per line
+        env_content = [
+            line for line in env_content
+            if line.partition('=')[0] not in MANAGED_ENV_KEYS
+        ]
         
         # Add new agent information
         env_content.append(f"AGENT_ENDPOINT={agent_info['endpoint_url']}\n")
@@ -359,9 +544,12 @@ def save_agent_info_to_env(agent_info, cognito_info=None):
             env_content.append(f"COGNITO_POOL_ID={cognito_info['pool_id']}\n")
             env_content.append(f"COGNITO_DISCOVERY_URL={cognito_info['discovery_url']}\n")
         
-        # Write back to .env file
-        with open('.env', 'w') as f:
+        # Write to a temp file and rename so .env is never left half-written
+        with tempfile.NamedTemporaryFile('w', dir='.', prefix='.env.', delete=False) as f:
             f.writelines(env_content)
+        if os.path.exists('.env'):
+            shutil.copymode('.env', f.name)
+        os.replace(f.name, '.env')
         
         print("💾 Agent information saved to .env file")
         return True
@@ -371,7 +559,7 @@ def save_agent_info_to_env(agent_info, cognito_info=None):
         return False
 
 
-def interactive_mode():
+def interactive_mode(use_cache=True):
     """Interactive mode to help users find and configure their agent."""
     print("🎯 SBOM Security Agent Information Helper")
     print("="*50)
@@ -381,7 +569,7 @@ def interactive_mode():
     print()
     
     # Find agent information
-    agent_info = find_agent_info()
+    agent_info = find_agent_info(use_cache=use_cache)
     
     if not agent_info:
         print("\n❌ Could not automatically find your agent.")
@@ -390,26 +578,18 @@ def interactive_mode():
         endpoint_url = get_endpoint_url_from_user()
         
         # Extract basic info from URL if possible
-        try:
-            from urllib.parse import urlparse
-            parsed = urlparse(endpoint_url)
-            hostname_parts = parsed.hostname.split('.')
-            if len(hostname_parts) >= 3 and 'bedrock-agentcore' in hostname_parts[1]:
-                agent_id = hostname_parts[0]
-                region = hostname_parts[2]
-                
-                agent_info = {
-                    "agent_id": agent_id,
-                    "agent_name": "sbom-security-agent",
-                    "endpoint_url": endpoint_url,
-                    "status": "Unknown",
-                    "region": region
-                }
-        except:
-            pass
+        match = _ENDPOINT_RE.match(endpoint_url)
+        if match:
+            agent_info = {
+                "agent_id": match.group('agent_id'),
+                "agent_name": "sbom-security-agent",
+                "endpoint_url": endpoint_url,
+                "status": "Unknown",
+                "region": match.group('region')
+            }
     
     # Find Cognito information
-    cognito_info = find_cognito_info()
+    cognito_info = find_cognito_info(use_cache=use_cache)
     
     # Save information to .env file
     if agent_info:
@@ -445,8 +625,8 @@ Examples:
     
     parser.add_argument(
         '--agent-name', 
-        default='sbom-security-agent',
-        help='Name of the agent to find (default: sbom-security-agent)'
+        default=DEFAULT_AGENT_NAME,
+        help=f'Name of the agent to find (default: {DEFAULT_AGENT_NAME})'
     )
     
     parser.add_argument(
@@ -467,11 +647,27 @@ Examples:
         help='Minimal output (useful for scripts)'
     )
     
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always query AWS instead of using cached discovery results'
+    )
+    
     args = parser.parse_args()
     
+    # Discovery progress is noise for scripts: --quiet drops it, and
+    # --endpoint-only keeps stdout to the URL alone
+    log = _silent if args.quiet or args.endpoint_only else print
+    
     if args.endpoint_only:
+        # An endpoint already in the environment or .env needs no AWS discovery
+        endpoint = _endpoint_from_env(args.agent_name)
+        if endpoint:
+            print(endpoint)
+            sys.exit(0)
+        
         # Just find and output the endpoint URL
-        agent_info = find_agent_info(args.agent_name)
+        agent_info = find_agent_info(args.agent_name, use_cache=not args.no_cache, log=log)
         if agent_info and agent_info.get('endpoint_url'):
             print(agent_info['endpoint_url'])
             sys.exit(0)
@@ -485,8 +681,8 @@ Examples:
         if not args.quiet:
             print("🔍 Auto-detecting agent information...")
         
-        agent_info = find_agent_info(args.agent_name)
-        cognito_info = find_cognito_info()
+        agent_info = find_agent_info(args.agent_name, use_cache=not args.no_cache, log=log)
+        cognito_info = find_cognito_info(use_cache=not args.no_cache, log=log)
         
         if agent_info:
             if save_agent_info_to_env(agent_info, cognito_info):
@@ -505,7 +701,7 @@ Examples:
     else:
         # Interactive mode
         try:
-            interactive_mode()
+            interactive_mode(use_cache=not args.no_cache)
         except KeyboardInterrupt:
             print("\n\n👋 Goodbye!")
             sys.exit(0)
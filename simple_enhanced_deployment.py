@@ -8,17 +8,47 @@ It focuses on what we can actually control: agent names and resource cleanup.
 
 import os
 import sys
+import re
 import argparse
-import boto3
-from bedrock_agentcore_starter_toolkit import Runtime
-from boto3.session import Session
-from utils import setup_cognito_user_pool
+import datetime
+from utils import client_factory, setup_cognito_user_pool, shared_session
 
 # Configuration
 AGENT_NAME = "sbom_security_agent"
 ENTRYPOINT = "sbom_agent.py"
 REQUIREMENTS_FILE = "requirements.txt"
 
+# Settings for the control-plane client: keep-alive connections so the
+# lookup and the create share one TLS session, and adaptive retries for
+# throttled calls
+BOTO_CONFIG_OPTIONS = {
+    'max_pool_connections': 10,
+    'tcp_keepalive': True,
+    'retries': {'mode': 'adaptive', 'max_attempts': 5},
+}
+
+# Conflict guidance, filled in with format_map and written with a single call each
+CONFLICT_HINT_TEXT = """
+💡 Conflict Resolution Options:
+1. Run with --auto-update to generate a unique name
+2. Run with --force-recreate to generate a new unique name
+3. Use --agent-name to specify a different name manually
+4. Clean up existing resources: python cleanup_deployment.py --execute
+5. List existing resources: python cleanup_deployment.py
+
+💡 Suggested unique name: {agent_name}
+   python simple_enhanced_deployment.py --agent-name {agent_name}"""
+
+REDEPLOY_HINT_TEXT = """
+🔄 Please redeploy using the new agent name:
+   python simple_enhanced_deployment.py --agent-name {agent_name}"""
+
+# Launch errors that mean the agent's resources already exist; one case-insensitive pass
+_CONFLICT_RE = re.compile(r'already\s*exists|conflict|duplicate', re.IGNORECASE)
+
+# Control-plane clients, built once per region from the shared session
+_client = client_factory(**BOTO_CONFIG_OPTIONS)
+
 
 def setup_github_oauth_provider():
     """Set up GitHub OAuth2 credential provider with conflict handling."""
@@ -33,24 +63,23 @@ def setup_github_oauth_provider():
         return False
     
     try:
-        boto_session = Session()
-        region = boto_session.region_name
-        agentcore_client = boto3.client('bedrock-agentcore-control', region_name=region)
+        region = shared_session().region_name
+        agentcore_client = _client('bedrock-agentcore-control', region)
         
         provider_name = 'github-provider'
         
-        # Check if provider already exists
+        # Check if provider already exists; a direct lookup by name costs one
+        # call however many providers the account has
         try:
-            existing_providers = agentcore_client.list_oauth2_credential_providers()
-            
-            for provider in existing_providers.get('oauth2CredentialProviders', []):
-                if provider.get('name') == provider_name:
-                    print(f"ℹ️  GitHub OAuth2 provider '{provider_name}' already exists")
-                    print("✅ Using existing GitHub OAuth2 provider")
-                    return True
-                    
-        except Exception as list_error:
-            print(f"⚠️  Could not list existing providers: {str(list_error)}")
+            agentcore_client.get_oauth2_credential_provider(name=provider_name)
+            print(f"ℹ️  GitHub OAuth2 provider '{provider_name}' already exists")
+            print("✅ Using existing GitHub OAuth2 provider")
+            return True
+        
+        except agentcore_client.exceptions.ResourceNotFoundException:
+            pass
+        except Exception as lookup_error:
+            print(f"⚠️  Could not look up existing provider: {str(lookup_error)}")
             print("   Proceeding to create new provider...")
         
         # Create new provider
@@ -116,8 +145,7 @@ def configure_runtime(agent_name, cognito_config):
     print("Configuring AgentCore Runtime deployment...")
     
     try:
-        boto_session = Session()
-        region = boto_session.region_name
+        region = shared_session().region_name
         
         if not region:
             print("❌ AWS region not configured. Please set AWS_DEFAULT_REGION or configure AWS CLI.")
@@ -125,7 +153,9 @@ def configure_runtime(agent_name, cognito_config):
         
         print(f"Using AWS region: {region}")
         
-        # Initialize AgentCore Runtime
+        # Initialize AgentCore Runtime; the toolkit is only loaded once it is needed
+        from bedrock_agentcore_starter_toolkit import Runtime
+        
         agentcore_runtime = Runtime()
         
         # Configure runtime
@@ -171,54 +201,39 @@ def deploy_with_conflict_handling(agentcore_runtime, agent_name, auto_update=Fal
         print(f"🔍 Full error message: {error_message}")  # Debug: show full error
         
         # Handle specific conflict errors - be more permissive with error detection
-        if ("already exists" in error_message.lower() or 
-            "conflict" in error_message.lower() or
-            "duplicate" in error_message.lower() or
-            "resourceconflictexception" in error_message.lower() or
-            "alreadyexists" in error_message.lower() or
-            "exists" in error_message.lower()):
+        if _CONFLICT_RE.search(error_message):
             
             print(f"⚠️  Deployment conflict detected: {error_message}")
             
+            # Unique names use only valid characters
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            
             if auto_update or force_recreate:
                 mode = "update" if auto_update else "recreate"
                 print(f"🔄 {mode.title()} mode: Generating unique agent name...")
                 
-                # Generate unique name (using only valid characters)
-                import datetime
-                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+                # Generate unique name
                 unique_agent_name = f"{agent_name}_{mode}_{timestamp}"
                 
                 print(f"🔄 Retrying deployment with unique name: {unique_agent_name}")
                 print("💡 You'll need to use this new name for future deployments")
                 
-                # Save the new name for reference
+                # Save the new name for reference, as a single write
+                entry = f"\n# Auto-generated agent name from conflict resolution\nAGENT_NAME={unique_agent_name}\n"
                 try:
-                    with open('.env', 'a') as f:
-                        f.write(f"\n# Auto-generated agent name from conflict resolution\n")
-                        f.write(f"AGENT_NAME={unique_agent_name}\n")
+                    with open('.env', 'ab') as f:
+                        f.write(entry.encode('utf-8'))
                     print(f"💾 Saved new agent name to .env file")
                 except Exception as env_error:
                     print(f"⚠️  Could not save to .env file: {str(env_error)}")
                 
                 # Return False to indicate the user needs to redeploy with the new name
-                print(f"\n🔄 Please redeploy using the new agent name:")
-                print(f"   python simple_enhanced_deployment.py --agent-name {unique_agent_name}")
+                print(REDEPLOY_HINT_TEXT.format_map({'agent_name': unique_agent_name}))
                 return False
             else:
-                print("\n💡 Conflict Resolution Options:")
-                print("1. Run with --auto-update to generate a unique name")
-                print("2. Run with --force-recreate to generate a new unique name")
-                print("3. Use --agent-name to specify a different name manually")
-                print("4. Clean up existing resources: python cleanup_deployment.py --execute")
-                print("5. List existing resources: python cleanup_deployment.py")
-                
-                # Generate a suggested unique name (using only valid characters)
-                import datetime
-                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+                # Suggest a unique name along with the other options
                 suggested_name = f"{agent_name}_{timestamp}"
-                print(f"\n💡 Suggested unique name: {suggested_name}")
-                print(f"   python simple_enhanced_deployment.py --agent-name {suggested_name}")
+                print(CONFLICT_HINT_TEXT.format_map({'agent_name': suggested_name}))
                 
                 return False
             
@@ -297,7 +312,8 @@ Examples:
         
         print()
         
-        # Step 2: Set up Cognito authentication
+        # Step 2: Set up Cognito authentication. This creates a user pool, so it
+        # only runs once the provider step has succeeded
         cognito_config = setup_cognito_auth()
         
         print()
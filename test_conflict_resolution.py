@@ -3,13 +3,18 @@
 Test script to verify conflict resolution logic works.
 """
 
-import datetime
+import itertools
+import time
+
+# Process-wide counter appended to generated agent names
+_NAME_SEQUENCE = itertools.count(1)
 
 
 def generate_unique_agent_name(base_name, mode="auto"):
-    """Generate a unique agent name with timestamp (using only valid characters)."""
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    return f"{base_name}_{mode}_{timestamp}"
+    """Generate a unique agent name with timestamp and sequence number (using only valid characters)."""
+    # The sequence number keeps names distinct even within the same second
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    return f"{base_name}_{mode}_{timestamp}_{next(_NAME_SEQUENCE)}"
 
 
 def test_name_generation():
@@ -9,40 +9,88 @@ a sample request and displaying the response.
 import os
 import sys
 import json
+import time
+import base64
+import tempfile
+import threading
 import requests
-from urllib.parse import urlparse
-from utils import reauthenticate_user
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ProtocolError
+from urllib3.util.retry import Retry
+from utils import reauthenticate_user, validate_endpoint_url
+# get_agent_info owns endpoint discovery: the environment variables, the
+# starter toolkit config and the AWS lookup
+from get_agent_info import find_agent_info, try_get_endpoint_from_deployment as find_deployment_endpoint
 
+# Throttling and unavailable-gateway errors from the agent endpoint, and failed
+# connects, are retried with exponential backoff honouring Retry-After; the final
+# response is returned rather than raised. Read errors and 504s are not retried:
+# the agent may already be running the analysis, and a stale socket is handled
+# by _post_to_agent
+AGENT_RETRY = Retry(
+    total=5,
+    read=0,
+    backoff_factor=1.5,
+    status_forcelist=(429, 502, 503),
+    allowed_methods=frozenset({'POST'}),
+    raise_on_status=False
+)
 
-def validate_endpoint_url(url):
-    """Validate and fix the endpoint URL format."""
-    if not url:
-        return None, "URL cannot be empty"
-    
-    # Remove whitespace
-    url = url.strip()
-    
-    # Add https:// if no protocol is specified
-    if not url.startswith(('http://', 'https://')):
-        url = 'https://' + url
-    
-    # Parse the URL to validate it
+# Cognito tokens are cached here per client until shortly before they expire
+TOKEN_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "sbom_agent")
+TOKEN_EXPIRY_MARGIN_SECONDS = 60
+
+# Explanations for the error statuses the agent endpoint commonly returns
+STATUS_HINTS = {
+    401: ("Authentication failed (401 Unauthorized)", (
+        "Check that your JWT token is valid and not expired",
+        "Try generating a new token",
+    )),
+    403: ("Access forbidden (403 Forbidden)", (
+        "Check that your JWT token has the correct permissions",
+        "Verify the Cognito User Pool configuration",
+    )),
+    404: ("Agent endpoint not found (404 Not Found)", (
+        "Check that the endpoint URL is correct",
+        "Verify the agent was deployed successfully",
+    )),
+}
+
+# Repository analysed when TEST_REPOSITORY is not set
+DEFAULT_TEST_REPOSITORY = "https://github.com/microsoft/vscode"
+
+# Repositories listed in TEST_REPOSITORY are tested at most this many at a time
+MAX_PARALLEL_TESTS = 8
+
+# Keeps each agent response together when several tests run at once
+_OUTPUT_LOCK = threading.Lock()
+
+# Serializes token refreshes, so parallel tests re-authenticate once between them
+_TOKEN_LOCK = threading.Lock()
+
+# One HTTP session per process so repeated tests reuse the TLS connection;
+# the pool holds a connection for every parallel test
+_HTTP = requests.Session()
+_HTTP.headers.update({"Content-Type": "application/json"})
+for _prefix in ('https://', 'http://'):
+    _HTTP.mount(_prefix, HTTPAdapter(pool_connections=10, pool_maxsize=MAX_PARALLEL_TESTS, max_retries=AGENT_RETRY))
+
+
+def _post_to_agent(url, **kwargs):
+    """POST to the agent, resending once on new connections if a pooled one went stale."""
     try:
-        parsed = urlparse(url)
-        if not parsed.netloc:
-            return None, "Invalid URL format"
-        
-        # Ensure it ends with /invocations if it doesn't already
-        if not parsed.path.endswith('/invocations'):
-            if parsed.path and not parsed.path.endswith('/'):
-                url += '/invocations'
-            else:
-                url += 'invocations'
-        
-        return url, None
-        
-    except Exception as e:
-        return None, f"Invalid URL: {str(e)}"
+        return _HTTP.post(url, **kwargs)
+    except requests.exceptions.Timeout:
+        raise
+    except requests.exceptions.ConnectionError as e:
+        # A keep-alive socket dropped by a NAT or VPN idle timeout is reset as soon
+        # as it is reused; failed connects were already retried by AGENT_RETRY
+        reason = e.args[0] if e.args else None
+        if not isinstance(getattr(reason, 'reason', reason), ProtocolError):
+            raise
+        _HTTP.close()
+        return _HTTP.post(url, **kwargs)
 
 
 def show_endpoint_help():
@@ -109,70 +157,164 @@ def get_endpoint_url_from_user():
         return validated_url
 
 
-def get_jwt_token(client_id):
-    """Get a fresh JWT token from Cognito."""
+def _token_cache_file(client_id):
+    """Return the path of the token cache file for a Cognito client."""
+    return os.path.join(TOKEN_CACHE_DIR, f"jwt_{client_id}.json")
+
+
+def _token_expiry(token):
+    """Return the exp claim of a JWT as a Unix timestamp, or 0 if it cannot be read."""
+    try:
+        claims = token.split('.')[1]
+        claims += '=' * (-len(claims) % 4)
+        return int(json.loads(base64.urlsafe_b64decode(claims)).get('exp', 0))
+    except (IndexError, ValueError, TypeError):
+        return 0
+
+
+def load_cached_token(client_id):
+    """Return the cached token for a client if it is not about to expire, otherwise None."""
+    try:
+        with open(_token_cache_file(client_id)) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if cached.get('exp', 0) - time.time() > TOKEN_EXPIRY_MARGIN_SECONDS:
+        return cached.get('token')
+    return None
+
+
+def save_cached_token(client_id, token):
+    """Cache a token until its expiry; the temp file is created private (0600) and renamed into place."""
+    exp = _token_expiry(token)
+    if not exp:
+        return
+    
+    try:
+        os.makedirs(TOKEN_CACHE_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', dir=TOKEN_CACHE_DIR, delete=False) as f:
+            json.dump({'token': token, 'exp': exp}, f)
+        os.replace(f.name, _token_cache_file(client_id))
+    except OSError as e:
+        print(f"⚠️  Could not cache JWT token: {str(e)}")
+
+
+def clear_cached_token(client_id):
+    """Remove the cached token for a client, if any."""
+    try:
+        os.remove(_token_cache_file(client_id))
+    except OSError:
+        pass
+
+
+def get_jwt_token(client_id, use_cache=True):
+    """Get a JWT token from Cognito, reusing a cached one until shortly before it expires."""
+    if use_cache:
+        token = load_cached_token(client_id)
+        if token:
+            print("🔑 Using cached JWT token")
+            return token
+    else:
+        clear_cached_token(client_id)
+    
     try:
         print("🔑 Getting fresh JWT token from Cognito...")
         token = reauthenticate_user(client_id)
         print("✅ JWT token obtained successfully")
+        save_cached_token(client_id, token)
         return token
     except Exception as e:
         print(f"❌ Failed to get JWT token: {str(e)}")
         return None
 
 
-def test_agent(endpoint_url, jwt_token, repository_url):
-    """Test the agent with a sample repository."""
+def _token_refresher(client_id, token):
+    """Return a refresh_token(rejected_token) that re-authenticates only while token is still current."""
+    current = {'token': token}
+    
+    def refresh(rejected_token):
+        with _TOKEN_LOCK:
+            # Tests rejected with a token another test already replaced reuse
+            # its result instead of asking Cognito again
+            if current['token'] == rejected_token:
+                current['token'] = get_jwt_token(client_id, use_cache=False)
+            return current['token']
+    
+    return refresh
+
+
+def print_agent_response(response):
+    """Print a streamed agent response without holding extra copies of the body."""
+    if 'json' not in response.headers.get('Content-Type', ''):
+        # Plain text or event streams are copied to stdout as they arrive
+        sys.stdout.flush()
+        for chunk in response.iter_content(chunk_size=65536):
+            sys.stdout.buffer.write(chunk)
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.flush()
+        return
+    
+    # Parse the raw bytes directly, skipping the decoded text copy, and pretty
+    # print straight to stdout rather than building the indented string
+    response.raw.decode_content = True
+    body = response.raw.read()
+    try:
+        json.dump(json.loads(body), sys.stdout, indent=2)
+        print()
+    except ValueError:
+        # If not valid JSON, print as text
+        print(body.decode(response.encoding or 'utf-8', errors='replace'))
+
+
+def test_agent(endpoint_url, jwt_token, repository_url, refresh_token=None):
+    """Test the agent with a sample repository, refreshing a rejected token once via refresh_token(jwt_token)."""
     print(f"🧪 Testing agent with repository: {repository_url}")
     
     payload = {
         "prompt": f"Analyze the repository {repository_url} for security vulnerabilities and generate an SBOM report"
     }
     
+    # Content-Type is set once on the session; only the token varies per call
     headers = {
-        "Content-Type": "application/json",
         "Authorization": f"Bearer {jwt_token}"
     }
     
     try:
         print("📡 Sending request to agent...")
-        response = requests.post(endpoint_url, json=payload, headers=headers, timeout=300)
+        response = _post_to_agent(endpoint_url, json=payload, headers=headers, timeout=300, stream=True)
+        
+        if response.status_code == 401 and refresh_token:
+            # A cached token may have been revoked; retry once with a fresh one
+            response.close()
+            print("🔑 Token was rejected, retrying with a fresh one...")
+            fresh_token = refresh_token(jwt_token)
+            if fresh_token:
+                headers["Authorization"] = f"Bearer {fresh_token}"
+                response = _post_to_agent(endpoint_url, json=payload, headers=headers, timeout=300, stream=True)
         
         print(f"📊 Response Status: {response.status_code}")
+        status_hint = STATUS_HINTS.get(response.status_code)
         
         if response.status_code == 200:
-            print("✅ Agent responded successfully!")
-            print("\n" + "="*60)
-            print("AGENT RESPONSE:")
-            print("="*60)
-            
-            # Try to parse as JSON for pretty printing
-            try:
-                response_json = response.json()
-                print(json.dumps(response_json, indent=2))
-            except json.JSONDecodeError:
-                # If not JSON, print as text
-                print(response.text)
+            with _OUTPUT_LOCK:
+                print(f"✅ Agent responded successfully for {repository_url}!")
+                print("\n" + "="*60)
+                print("AGENT RESPONSE:")
+                print("="*60)
+                print_agent_response(response)
                 
-        elif response.status_code == 401:
-            print("❌ Authentication failed (401 Unauthorized)")
-            print("   - Check that your JWT token is valid and not expired")
-            print("   - Try generating a new token")
-            
-        elif response.status_code == 403:
-            print("❌ Access forbidden (403 Forbidden)")
-            print("   - Check that your JWT token has the correct permissions")
-            print("   - Verify the Cognito User Pool configuration")
-            
-        elif response.status_code == 404:
-            print("❌ Agent endpoint not found (404 Not Found)")
-            print("   - Check that the endpoint URL is correct")
-            print("   - Verify the agent was deployed successfully")
+        elif status_hint:
+            summary, hints = status_hint
+            print(f"❌ {summary}")
+            for hint in hints:
+                print(f"   - {hint}")
             
         else:
             print(f"❌ Unexpected response status: {response.status_code}")
             print(f"Response: {response.text}")
-            
+        
+        response.close()
         return response.status_code == 200
         
     except requests.exceptions.Timeout:
@@ -211,45 +353,38 @@ def test_agent(endpoint_url, jwt_token, repository_url):
         return False
 
 
+def test_repositories(endpoint_url, jwt_token, repository_urls, refresh_token=None):
+    """Test the agent with each repository, several at a time; True if every test passed."""
+    if len(repository_urls) == 1:
+        return test_agent(endpoint_url, jwt_token, repository_urls[0], refresh_token)
+    
+    # The requests wait on the agent, so overlap them over the pooled session
+    workers = min(len(repository_urls), MAX_PARALLEL_TESTS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(
+            lambda repository_url: test_agent(endpoint_url, jwt_token, repository_url, refresh_token),
+            repository_urls
+        ))
+    
+    failed = [url for url, passed in zip(repository_urls, results) if not passed]
+    print(f"\n📊 {len(repository_urls) - len(failed)}/{len(repository_urls)} repository tests passed")
+    for url in failed:
+        print(f"   ❌ {url}")
+    return not failed
+
+
 def try_get_endpoint_from_deployment():
     """Try to get the endpoint URL from recent deployment output."""
     try:
-        # Try using the get_agent_info module for better detection
-        try:
-            from get_agent_info import find_agent_info, try_get_endpoint_from_deployment as get_endpoint
-            
-            # First try the deployment files method
-            endpoint = get_endpoint()
-            if endpoint:
-                return endpoint
-            
-            # Then try AWS API detection
-            agent_info = find_agent_info("sbom-security-agent")
-            if agent_info and agent_info.get('endpoint_url'):
-                return agent_info['endpoint_url']
-                
-        except ImportError:
-            # Fallback to original method if get_agent_info is not available
-            pass
-        
-        # Check if there's a .bedrock_agentcore.yaml file (created by starter toolkit)
-        if os.path.exists('.bedrock_agentcore.yaml'):
-            print("📄 Found .bedrock_agentcore.yaml file from deployment")
-            with open('.bedrock_agentcore.yaml', 'r') as f:
-                content = f.read()
-                print("   You can check this file for configuration details")
-        
-        # Check for common environment variables
-        possible_env_vars = [
-            'AGENT_ENDPOINT', 'AGENTCORE_ENDPOINT', 'BEDROCK_AGENT_ENDPOINT',
-            'AGENT_URL', 'INVOKE_URL', 'ENDPOINT_URL'
-        ]
+        # First try the environment and deployment files
+        endpoint = find_deployment_endpoint()
+        if endpoint:
+            return endpoint
         
-        for var in possible_env_vars:
-            value = os.getenv(var)
-            if value:
-                print(f"📍 Found endpoint in environment variable {var}: {value}")
-                return value
+        # Then try AWS API detection
+        agent_info = find_agent_info("sbom-security-agent")
+        if agent_info and agent_info.get('endpoint_url'):
+            return agent_info['endpoint_url']
         
         return None
         
@@ -270,7 +405,10 @@ def main():
     # Get configuration from environment or user input
     endpoint_url = os.getenv("AGENT_ENDPOINT")
     client_id = os.getenv("COGNITO_CLIENT_ID")
-    repository_url = os.getenv("TEST_REPOSITORY", "https://github.com/microsoft/vscode")
+    # TEST_REPOSITORY may list several repositories, separated by commas
+    repository_urls = [
+        url.strip() for url in os.getenv("TEST_REPOSITORY", "").split(',') if url.strip()
+    ] or [DEFAULT_TEST_REPOSITORY]
     
     # Try to auto-detect endpoint if not provided
     if not endpoint_url:
@@ -297,7 +435,7 @@ def main():
     
     print(f"🎯 Agent Endpoint: {endpoint_url}")
     print(f"🔑 Cognito Client ID: {client_id}")
-    print(f"📁 Test Repository: {repository_url}")
+    print(f"📁 Test Repository: {', '.join(repository_urls)}")
     print()
     
     # Get JWT token
@@ -309,7 +447,10 @@ def main():
     print()
     
     # Test the agent
-    success = test_agent(endpoint_url, jwt_token, repository_url)
+    success = test_repositories(
+        endpoint_url, jwt_token, repository_urls,
+        refresh_token=_token_refresher(client_id, jwt_token)
+    )
     
     print("\n" + "="*50)
     if success:
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Test script to verify endpoint URL validation and normalization.
+"""
+
+from utils import validate_endpoint_url
+
+
+INVOKE_URL = (
+    "https://bedrock-agentcore.us-east-1.amazonaws.com/runtimes/"
+    "arn%3Aaws%3Abedrock-agentcore%3Aus-east-1%3A123456789012%3Aruntime%2Fsbom_agent-AbC123"
+    "/invocations?qualifier=DEFAULT"
+)
+
+CASES = [
+    ("abcd1234.bedrock-agentcore.us-east-1.amazonaws.com",
+     "https://abcd1234.bedrock-agentcore.us-east-1.amazonaws.com/invocations"),
+    ("https://abcd1234.bedrock-agentcore.us-east-1.amazonaws.com/",
+     "https://abcd1234.bedrock-agentcore.us-east-1.amazonaws.com/invocations"),
+    ("https://abcd1234.bedrock-agentcore.us-east-1.amazonaws.com/invocations/",
+     "https://abcd1234.bedrock-agentcore.us-east-1.amazonaws.com/invocations"),
+    ("http://localhost:8080", "http://localhost:8080/invocations"),
+    (INVOKE_URL, INVOKE_URL),
+    ("https://example.com/api?qualifier=DEFAULT", "https://example.com/api/invocations?qualifier=DEFAULT"),
+]
+
+
+def test_valid_urls():
+    """Valid URLs are normalized to end in /invocations, keeping any query string."""
+    for url, expected in CASES:
+        validated, error = validate_endpoint_url(url)
+        assert error is None, (url, error)
+        assert validated == expected, (url, validated)
+        print(f"✅ {url} -> {validated}")
+
+
+def test_invalid_urls():
+    """Empty input and unsupported schemes are rejected."""
+    for url in ("", "https://", "ftp://example.com"):
+        validated, error = validate_endpoint_url(url)
+        assert validated is None and error, (url, validated)
+        print(f"✅ Rejected {url!r}: {error}")
+
+
+if __name__ == "__main__":
+    test_valid_urls()
+    test_invalid_urls()
+    print("\n✅ Endpoint validation working correctly!")
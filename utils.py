@@ -1,18 +1,79 @@
-import boto3
+import functools
 import json
+import re
+import threading
 import time
-from boto3.session import Session
 
 USER_NAME = "testuser"
 PASSWORD = "MyPassword123!"
 TEMP_ADMIN_PASSWORD = "Temp123!"
 
+# One AWS session per process, created on first use; boto3 is only imported
+# then, so scripts that exit before reaching AWS never load it
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def shared_session():
+    """Return the process-wide AWS session, creating it on first use."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            from boto3.session import Session
+            _SESSION = Session()
+        return _SESSION
+
+
+def client_factory(**config_options):
+    """Return a get_client(service_name, region=None) that builds each client once with these botocore options."""
+    @functools.lru_cache(maxsize=None)
+    def get_client(service_name, region=None):
+        from botocore.config import Config
+
+        session = shared_session()
+        # Sessions are not thread-safe, so serialize client construction
+        with _SESSION_LOCK:
+            return session.client(
+                service_name, region_name=region, config=Config(**config_options)
+            )
+
+    return get_client
+
+
+# Clients for the helpers below, with botocore's default settings
+_client = client_factory()
+
+# Endpoint URL with optional scheme, a host (and port), an optional path and query
+_URL_RE = re.compile(
+    r'^(?:(?P<scheme>https?)://)?(?P<host>[^/\s:?]+(?::\d+)?)(?P<path>/[^?\s]*)?(?P<query>\?\S*)?$'
+)
+
+
+def validate_endpoint_url(url):
+    """Validate and fix the endpoint URL format."""
+    if not url:
+        return None, "URL cannot be empty"
+
+    # Split scheme, host and path in one pass, ignoring surrounding whitespace
+    match = _URL_RE.match(url.strip())
+    if not match:
+        return None, "Invalid URL format"
+
+    # Default to https:// if no protocol is specified
+    scheme = match.group('scheme') or 'https'
+
+    # Ensure it ends with /invocations if it doesn't already
+    path = (match.group('path') or '').rstrip('/')
+    if not path.endswith('/invocations'):
+        path += '/invocations'
+
+    return f"{scheme}://{match.group('host')}{path}{match.group('query') or ''}", None
+
 
 def setup_cognito_user_pool():
-    boto_session = Session()
-    region = boto_session.region_name
+    region = shared_session().region_name
     # Initialize Cognito client
-    cognito_client = boto3.client("cognito-idp", region_name=region)
+    cognito_client = _client("cognito-idp", region)
     try:
         # Create User Pool
         user_pool_response = cognito_client.create_user_pool(
@@ -69,10 +130,9 @@ def setup_cognito_user_pool():
 
 
 def reauthenticate_user(client_id):
-    boto_session = Session()
-    region = boto_session.region_name
+    region = shared_session().region_name
     # Initialize Cognito client
-    cognito_client = boto3.client("cognito-idp", region_name=region)
+    cognito_client = _client("cognito-idp", region)
     # Authenticate User and get Access Token
     auth_response = cognito_client.initiate_auth(
         ClientId=client_id,
@@ -84,11 +144,10 @@ def reauthenticate_user(client_id):
 
 
 def create_agentcore_role(agent_name):
-    iam_client = boto3.client("iam")
+    iam_client = _client("iam")
     agentcore_role_name = f"agentcore-{agent_name}-role"
-    boto_session = Session()
-    region = boto_session.region_name
-    account_id = boto3.client("sts").get_caller_identity()["Account"]
+    region = shared_session().region_name
+    account_id = _client("sts").get_caller_identity()["Account"]
     role_policy = {
         "Version": "2012-10-17",
         "Statement": [
@@ -9,21 +9,30 @@ import os
 import sys
 import argparse
 import datetime
-from deployment_config import (
-    setup_github_oauth_provider,
-    setup_cognito_auth,
-    configure_agentcore_runtime
-)
+import itertools
+import time
+
+# Process-wide counter appended to generated agent names
+_NAME_SEQUENCE = itertools.count(1)
 
 
 def generate_unique_agent_name(base_name, mode="auto"):
-    """Generate a unique agent name with timestamp (using only valid characters)."""
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    return f"{base_name}_{mode}_{timestamp}"
+    """Generate a unique agent name with timestamp and sequence number (using only valid characters)."""
+    # The sequence number keeps names distinct even within the same second
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    return f"{base_name}_{mode}_{timestamp}_{next(_NAME_SEQUENCE)}"
+
+
+def _env_append(lines):
+    """Append lines to .env with a single write."""
+    with open('.env', 'a') as f:
+        f.write(''.join(lines))
 
 
 def deploy_with_conflict_resolution(base_agent_name, auto_update=False, force_recreate=False):
     """Deploy agent with working conflict resolution."""
+    # Imported here so --help and argument errors skip loading boto3 and the toolkit
+    from deployment_config import setup_github_oauth_provider, configure_agentcore_runtime
     
     # Determine the agent name to use
     if auto_update:
@@ -108,9 +117,10 @@ def deploy_with_conflict_resolution(base_agent_name, auto_update=False, force_re
         # Save the agent name for future reference
         if agent_name != base_agent_name:
             try:
-                with open('.env', 'a') as f:
-                    f.write(f"\n# Auto-generated agent name from conflict resolution ({datetime.datetime.now()})\n")
-                    f.write(f"DEPLOYED_AGENT_NAME={agent_name}\n")
+                _env_append((
+                    f"\n# Auto-generated agent name from conflict resolution ({datetime.datetime.now()})\n",
+                    f"DEPLOYED_AGENT_NAME={agent_name}\n",
+                ))
                 print(f"💾 Saved deployed agent name to .env file")
                 print(f"💡 Use this name for future operations: {agent_name}")
             except Exception as env_error: